@@ -2159,6 +2159,62 @@ PyObject* igraphmodule_vector_ptr_t_to_PyList(const igraph_vector_ptr_t *v,
   return list;
 }
 
+/**
+ * \ingroup python_interface_conversion
+ * \brief Converts an \c igraph_adjlist_t to a Python list of lists of integers
+ *
+ * \param al the \c igraph_adjlist_t containing the adjacency list to be converted
+ * \return the Python list of lists as a \c PyObject*, or \c NULL if an error occurred
+ */
+PyObject* igraphmodule_adjlist_t_to_PyList(const igraph_adjlist_t *al) {
+  PyObject *list, *item;
+  Py_ssize_t n, i;
+
+  n=igraph_adjlist_size(al);
+  list=PyList_New(n);
+  if (!list)
+    return NULL;
+
+  for (i=0; i<n; i++) {
+    item=igraphmodule_vector_int_t_to_PyList(igraph_adjlist_get(al, i));
+    if (item == NULL) {
+      Py_DECREF(list);
+      return NULL;
+    }
+    PyList_SET_ITEM(list, i, item);
+  }
+
+  return list;
+}
+
+/**
+ * \ingroup python_interface_conversion
+ * \brief Converts an \c igraph_inclist_t to a Python list of lists of integers
+ *
+ * \param il the \c igraph_inclist_t containing the incidence list to be converted
+ * \return the Python list of lists as a \c PyObject*, or \c NULL if an error occurred
+ */
+PyObject* igraphmodule_inclist_t_to_PyList(const igraph_inclist_t *il) {
+  PyObject *list, *item;
+  Py_ssize_t n, i;
+
+  n=igraph_inclist_size(il);
+  list=PyList_New(n);
+  if (!list)
+    return NULL;
+
+  for (i=0; i<n; i++) {
+    item=igraphmodule_vector_int_t_to_PyList(igraph_inclist_get(il, i));
+    if (item == NULL) {
+      Py_DECREF(list);
+      return NULL;
+    }
+    PyList_SET_ITEM(list, i, item);
+  }
+
+  return list;
+}
+
 /**
  * \ingroup python_interface_conversion
  * \brief Converts a Python list of lists to an \c igraph_matrix_t
@@ -157,4 +157,6 @@ PyObject* igraphmodule_vector_int_t_to_PyList(const igraph_vector_int_t *v);
 PyObject* igraphmodule_vector_long_t_to_PyList(const igraph_vector_long_t *v);
 PyObject* igraphmodule_matrix_t_to_PyList(const igraph_matrix_t *m,
         igraphmodule_conv_t type);
+PyObject* igraphmodule_adjlist_t_to_PyList(const igraph_adjlist_t *al);
+PyObject* igraphmodule_inclist_t_to_PyList(const igraph_inclist_t *il);
 #endif
@@ -1295,6 +1295,76 @@ PyObject *igraphmodule_Graph_incident(igraphmodule_GraphObject * self,
   return list;
 }
 
+/** \ingroup python_interface_graph
+ * \brief The neighbors of all the vertices in an \c igraph.Graph
+ * This method returns the adjacency list representation of the graph
+ * as a list of lists, constructed in a single pass in C.
+ * \return the neighbors of all the vertices as a list of lists
+ * \sa igraph_adjlist_init
+ */
+PyObject *igraphmodule_Graph_get_adjlist(igraphmodule_GraphObject * self,
+                                         PyObject * args, PyObject * kwds)
+{
+  PyObject *list, *dmode_o = Py_None;
+  igraph_neimode_t dmode = IGRAPH_OUT;
+  igraph_adjlist_t adjlist;
+
+  static char *kwlist[] = { "mode", NULL };
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O", kwlist, &dmode_o))
+    return NULL;
+
+  if (igraphmodule_PyObject_to_neimode_t(dmode_o, &dmode))
+    return NULL;
+
+  /* Loops and multiple edges are kept so the result matches what
+   * igraph_neighbors() would return for each vertex */
+  if (igraph_adjlist_init(&self->g, &adjlist, dmode, IGRAPH_LOOPS_TWICE, IGRAPH_MULTIPLE)) {
+    igraphmodule_handle_igraph_error();
+    return NULL;
+  }
+
+  list = igraphmodule_adjlist_t_to_PyList(&adjlist);
+  igraph_adjlist_destroy(&adjlist);
+
+  return list;
+}
+
+/** \ingroup python_interface_graph
+ * \brief The incident edges of all the vertices in an \c igraph.Graph
+ * This method returns the incidence list representation of the graph
+ * as a list of lists, constructed in a single pass in C.
+ * \return the incident edges of all the vertices as a list of lists
+ * \sa igraph_inclist_init
+ */
+PyObject *igraphmodule_Graph_get_inclist(igraphmodule_GraphObject * self,
+                                         PyObject * args, PyObject * kwds)
+{
+  PyObject *list, *dmode_o = Py_None;
+  igraph_neimode_t dmode = IGRAPH_OUT;
+  igraph_inclist_t inclist;
+
+  static char *kwlist[] = { "mode", NULL };
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O", kwlist, &dmode_o))
+    return NULL;
+
+  if (igraphmodule_PyObject_to_neimode_t(dmode_o, &dmode))
+    return NULL;
+
+  /* Loop edges are kept twice so the result matches what
+   * igraph_incident() would return for each vertex */
+  if (igraph_inclist_init(&self->g, &inclist, dmode, IGRAPH_LOOPS_TWICE)) {
+    igraphmodule_handle_igraph_error();
+    return NULL;
+  }
+
+  list = igraphmodule_inclist_t_to_PyList(&inclist);
+  igraph_inclist_destroy(&inclist);
+
+  return list;
+}
+
 /** \ingroup python_interface_graph
  * \brief Calculates the graph reciprocity
  * \return the reciprocity
@@ -11864,13 +11934,17 @@ PyObject *igraphmodule_Graph_community_multilevel(igraphmodule_GraphObject *self
   PyObject *mss, *qs, *res, *weights = Py_None;
   igraph_matrix_t memberships;
   igraph_vector_t membership, modularity;
+  igraph_real_t q;
   double resolution = 1;
   igraph_vector_t *ws;
+  igraph_bool_t levels;
 
   if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OOd", kwlist, &weights, &return_levels, &resolution)) {
     return NULL;
   }
 
+  levels = PyObject_IsTrue(return_levels);
+
   if (igraphmodule_attrib_to_vector_t(weights, self, &ws, ATTRIBUTE_TYPE_EDGE))
     return NULL;
 
@@ -11878,8 +11952,10 @@ PyObject *igraphmodule_Graph_community_multilevel(igraphmodule_GraphObject *self
   igraph_vector_init(&membership, 0);
   igraph_vector_init(&modularity, 0);
 
-  if (igraph_community_multilevel(&self->g, ws, resolution, &membership, &memberships,
-        &modularity)) {
+  /* The membership vectors of the individual levels are needed only if the
+   * caller asked for them */
+  if (igraph_community_multilevel(&self->g, ws, resolution, &membership,
+        levels ? &memberships : 0, &modularity)) {
     if (ws) { igraph_vector_destroy(ws); free(ws); }
     igraph_vector_destroy(&membership);
     igraph_vector_destroy(&modularity);
@@ -11889,25 +11965,32 @@ PyObject *igraphmodule_Graph_community_multilevel(igraphmodule_GraphObject *self
 
   if (ws) { igraph_vector_destroy(ws); free(ws); }
 
-  qs=igraphmodule_vector_t_to_PyList(&modularity, IGRAPHMODULE_TYPE_FLOAT);
-  igraph_vector_destroy(&modularity);
-  if (!qs) {
-    igraph_vector_destroy(&membership);
-    igraph_matrix_destroy(&memberships);
-    return NULL;
-  }
-
-  if (PyObject_IsTrue(return_levels)) {
-    mss=igraphmodule_matrix_t_to_PyList(&memberships, IGRAPHMODULE_TYPE_INT);
-    if (!mss) {
-      res = mss;
+  if (levels) {
+    qs=igraphmodule_vector_t_to_PyList(&modularity, IGRAPHMODULE_TYPE_FLOAT);
+    if (!qs) {
+      res = NULL;
     } else {
-      res=Py_BuildValue("NN", mss, qs); /* steals references */
+      mss=igraphmodule_matrix_t_to_PyList(&memberships, IGRAPHMODULE_TYPE_INT);
+      if (!mss) {
+        Py_DECREF(qs);
+        res = NULL;
+      } else {
+        res=Py_BuildValue("NN", mss, qs); /* steals references */
+      }
     }
   } else {
-    res=igraphmodule_vector_t_to_PyList(&membership, IGRAPHMODULE_TYPE_INT);
+    /* The final membership belongs to the last level, and so does the last
+     * modularity score */
+    q = VECTOR(modularity)[igraph_vector_size(&modularity) - 1];
+    mss=igraphmodule_vector_t_to_PyList(&membership, IGRAPHMODULE_TYPE_INT);
+    if (!mss) {
+      res = NULL;
+    } else {
+      res=Py_BuildValue("Nd", mss, (double)q); /* steals reference */
+    }
   }
 
+  igraph_vector_destroy(&modularity);
   igraph_vector_destroy(&membership);
   igraph_matrix_destroy(&memberships);
 
@@ -12594,6 +12677,20 @@ struct PyMethodDef igraphmodule_Graph_methods[] = {
    "  predecessors (C{\"in\"}) or both (C{\"all\"}). Ignored for undirected\n"
    "  graphs."},
 
+  /* interface to igraph_adjlist_init */
+  {"_get_adjlist", (PyCFunction) igraphmodule_Graph_get_adjlist,
+   METH_VARARGS | METH_KEYWORDS,
+   "_get_adjlist(mode=\"out\")\n--\n\n"
+   "Internal function, undocumented.\n\n"
+   "@see: Graph.get_adjlist()\n\n"},
+
+  /* interface to igraph_inclist_init */
+  {"_get_inclist", (PyCFunction) igraphmodule_Graph_get_inclist,
+   METH_VARARGS | METH_KEYWORDS,
+   "_get_inclist(mode=\"out\")\n--\n\n"
+   "Internal function, undocumented.\n\n"
+   "@see: Graph.get_inclist()\n\n"},
+
   //////////////////////
   // GRAPH GENERATORS //
   //////////////////////
@@ -16266,10 +16363,10 @@ struct PyMethodDef igraphmodule_Graph_methods[] = {
    "  Smaller values result in a smaller number of larger clusters, while higher\n"
    "  values yield a large number of small clusters. The classical modularity\n"
    "  measure assumes a resolution parameter of 1.\n"
-   "@return: either a single list describing the community membership of each\n"
-   "  vertex (if C{return_levels} is C{False}), or a list of community membership\n"
-   "  vectors, one corresponding to each level and a list of corresponding\n"
-   "  modularities (if C{return_levels} is C{True}).\n"
+   "@return: either a list describing the community membership of each vertex\n"
+   "  and the corresponding modularity (if C{return_levels} is C{False}), or a\n"
+   "  list of community membership vectors, one corresponding to each level and\n"
+   "  a list of corresponding modularities (if C{return_levels} is C{True}).\n"
    "\n"
    "@newfield ref: Reference\n"
    "@ref: VD Blondel, J-L Guillaume, R Lambiotte and E Lefebvre: Fast\n"
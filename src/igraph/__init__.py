@@ -89,27 +89,6 @@ from igraph.clustering import (
 )
 from igraph.cut import Cut, Flow
 from igraph.configuration import Configuration, init as init_configuration
-from igraph.drawing import BoundingBox, DefaultGraphDrawer, Plot, Point, Rectangle, plot
-from igraph.drawing.colors import (
-    Palette,
-    GradientPalette,
-    AdvancedGradientPalette,
-    RainbowPalette,
-    PrecalculatedPalette,
-    ClusterColoringPalette,
-    color_name_to_rgb,
-    color_name_to_rgba,
-    hsv_to_rgb,
-    hsva_to_rgba,
-    hsl_to_rgb,
-    hsla_to_rgba,
-    rgb_to_hsv,
-    rgba_to_hsva,
-    rgb_to_hsl,
-    rgba_to_hsla,
-    palettes,
-    known_colors,
-)
 from igraph.datatypes import Matrix, DyadCensus, TriadCensus, UniqueIdGenerator
 from igraph.formula import construct_graph_from_formula
 from igraph.layout import Layout
@@ -137,7 +116,9 @@ from igraph.utils import (
 )
 from igraph.version import __version__, __version_info__
 from igraph.sparse_matrix import (
+    _convert_mode_argument,
     _graph_from_sparse_matrix,
+    _graph_from_sparse_ndarray,
     _graph_from_weighted_sparse_matrix,
 )
 
@@ -148,8 +129,76 @@ import sys
 import operator
 
 from collections import defaultdict
+from functools import lru_cache
+from importlib import import_module
+from itertools import chain, islice, repeat
 from shutil import copyfileobj
-from warnings import warn
+from warnings import catch_warnings, simplefilter, warn
+
+# Drawing-related names that are re-exported from this module. They are
+# imported on first access only (see __getattr__() at the end of the module)
+# so that "import igraph" does not have to load the drawing subpackage.
+_LAZY_DRAWING_IMPORTS = {
+    "BoundingBox": "igraph.drawing",
+    "DefaultGraphDrawer": "igraph.drawing",
+    "Plot": "igraph.drawing",
+    "Point": "igraph.drawing",
+    "Rectangle": "igraph.drawing",
+    "plot": "igraph.drawing",
+    "Palette": "igraph.drawing.colors",
+    "GradientPalette": "igraph.drawing.colors",
+    "AdvancedGradientPalette": "igraph.drawing.colors",
+    "RainbowPalette": "igraph.drawing.colors",
+    "PrecalculatedPalette": "igraph.drawing.colors",
+    "ClusterColoringPalette": "igraph.drawing.colors",
+    "color_name_to_rgb": "igraph.drawing.colors",
+    "color_name_to_rgba": "igraph.drawing.colors",
+    "hsv_to_rgb": "igraph.drawing.colors",
+    "hsva_to_rgba": "igraph.drawing.colors",
+    "hsl_to_rgb": "igraph.drawing.colors",
+    "hsla_to_rgba": "igraph.drawing.colors",
+    "rgb_to_hsv": "igraph.drawing.colors",
+    "rgba_to_hsva": "igraph.drawing.colors",
+    "rgb_to_hsl": "igraph.drawing.colors",
+    "rgba_to_hsla": "igraph.drawing.colors",
+    "palettes": "igraph.drawing.colors",
+    "known_colors": "igraph.drawing.colors",
+}
+
+# Unbound methods of GraphBase that are wrapped by Graph. Binding them to
+# module-level names saves an attribute lookup on GraphBase per call.
+_GB_add_edges = GraphBase.add_edges
+_GB_add_vertices = GraphBase.add_vertices
+_GB_all_st_cuts = GraphBase.all_st_cuts
+_GB_all_st_mincuts = GraphBase.all_st_mincuts
+_GB_biconnected_components = GraphBase.biconnected_components
+_GB_clusters = GraphBase.clusters
+_GB_cohesive_blocks = GraphBase.cohesive_blocks
+_GB_community_edge_betweenness = GraphBase.community_edge_betweenness
+_GB_community_fastgreedy = GraphBase.community_fastgreedy
+_GB_community_infomap = GraphBase.community_infomap
+_GB_community_label_propagation = GraphBase.community_label_propagation
+_GB_community_leading_eigenvector = GraphBase.community_leading_eigenvector
+_GB_community_leiden = GraphBase.community_leiden
+_GB_community_multilevel = GraphBase.community_multilevel
+_GB_community_optimal_modularity = GraphBase.community_optimal_modularity
+_GB_community_spinglass = GraphBase.community_spinglass
+_GB_community_walktrap = GraphBase.community_walktrap
+_GB_delete_edges = GraphBase.delete_edges
+_GB_dyad_census = GraphBase.dyad_census
+_GB_get_adjacency = GraphBase.get_adjacency
+_GB_gomory_hu_tree = GraphBase.gomory_hu_tree
+_GB_layout_sugiyama = GraphBase._layout_sugiyama
+_GB_maxflow = GraphBase.maxflow
+_GB_maximum_bipartite_matching = GraphBase._maximum_bipartite_matching
+_GB_mincut = GraphBase.mincut
+_GB_modularity = GraphBase.modularity
+_GB_path_length_hist = GraphBase.path_length_hist
+_GB_spanning_tree = GraphBase._spanning_tree
+_GB_st_mincut = GraphBase.st_mincut
+_GB_transitivity_avglocal_undirected = GraphBase.transitivity_avglocal_undirected
+_GB_triad_census = GraphBase.triad_census
+_GB_write_dimacs = GraphBase.write_dimacs
 
 
 def deprecated(message):
@@ -158,6 +207,132 @@ def deprecated(message):
     warn(message, DeprecationWarning, stacklevel=3)
 
 
+# Chunk size used when copying between compressed and uncompressed files
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Default values of the positional arguments of Graph.__init__()
+_GRAPH_INIT_DEFAULTS = (0, None, False, None, None, None)
+
+
+class _SelectLookupSet(frozenset):
+    """Frozenset built by L{_select_lookup_values()} from a list or tuple given
+    to the C{in} and C{notin} select() operators."""
+
+
+def _select_in(item, values):
+    """Membership test of the C{in} and C{notin} select() operators. Falls
+    back to comparing the items one by one if C{item} is unhashable and
+    C{values} is a set built by L{_select_lookup_values()} from a list or
+    tuple; any other C{TypeError} is propagated."""
+    try:
+        return item in values
+    except TypeError:
+        if type(values) is not _SelectLookupSet:
+            raise
+        return any(item == value for value in values)
+
+
+def _select_lookup_values(values):
+    """Converts the list or tuple given to the C{in} and C{notin} select()
+    operators to a frozenset so the membership tests take constant time.
+    Other objects, and lists with unhashable items, are returned intact."""
+    if isinstance(values, (list, tuple)):
+        try:
+            return _SelectLookupSet(values)
+        except TypeError:
+            pass
+    return values
+
+
+# Filtering operators understood by VertexSeq.select() and EdgeSeq.select()
+_SELECT_OPERATORS = {
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "le": operator.le,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "in": _select_in,
+    "notin": lambda a, b: not _select_in(a, b),
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_select_keyword(keyword):
+    """Splits a keyword argument of select() into the name of the attribute
+    (or method) it refers to, the name of the operator and the operator
+    itself. Keywords are parsed once and then served from a cache as the
+    same filters tend to be used over and over again."""
+    if "_" not in keyword or keyword.rindex("_") == 0:
+        keyword += "_eq"
+    attr, _, op = keyword.rpartition("_")
+    try:
+        func = _SELECT_OPERATORS[op]
+    except KeyError:
+        # No such operator, assume that it's part of the attribute name
+        attr, op, func = keyword, "eq", _SELECT_OPERATORS["eq"]
+    return attr, op, func
+
+
+# Operators that select() may evaluate with NumPy on numeric columns, and the
+# shortest column where converting it to an array pays off
+_SELECT_NUMERIC_OPERATORS = frozenset(("lt", "gt", "le", "ge", "eq", "ne"))
+_SELECT_NUMERIC_MIN_SIZE = 1024
+# Integers below this magnitude are all exactly representable as floats
+_SELECT_NUMERIC_EXACT_LIMIT = 2 ** 53
+
+
+def _select_numeric(values, op, value):
+    """Evaluates a comparison select() operator on a whole column of numeric
+    values with NumPy. Returns the positions of the matching items, or
+    C{None} if NumPy is not available, the column is too short to be worth
+    converting or it does not consist of plain numbers only.
+
+    NumPy compares integers and floats as floats, which is exact only for
+    integers whose magnitude is below 2**53; columns or values that do not
+    satisfy this are also left to the caller so the result is always the
+    same as with Python comparisons."""
+    if (
+        op not in _SELECT_NUMERIC_OPERATORS
+        or type(value) not in (int, float)
+        or len(values) < _SELECT_NUMERIC_MIN_SIZE
+    ):
+        return None
+    if type(value) is int and abs(value) >= _SELECT_NUMERIC_EXACT_LIMIT:
+        return None
+
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    try:
+        values = np.array(values)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim != 1 or values.dtype.kind not in "biuf":
+        return None
+    if values.dtype.kind != "b":
+        # Integers that were converted to floats may have been rounded, and
+        # integers compared with floats will be. A rounded integer is never
+        # smaller than 2**53 in magnitude, so the bounds of the converted
+        # column tell whether this may have happened. NaNs are ignored here
+        low = np.fmin.reduce(values, initial=0).item()
+        high = np.fmax.reduce(values, initial=0).item()
+        limit = _SELECT_NUMERIC_EXACT_LIMIT
+        if not (-limit < low and high < limit):
+            return None
+
+    return np.flatnonzero(_SELECT_OPERATORS[op](values, value)).tolist()
+
+
+def _set_attributes(target, attrs):
+    """Assigns the attributes in the given dict to a graph, a vertex sequence
+    or an edge sequence. Non-string keys are converted to strings."""
+    for key, value in attrs.items():
+        target[key if type(key) is str else str(key)] = value
+
+
 class Graph(GraphBase):
     """Generic graph.
 
@@ -258,45 +433,38 @@ class Graph(GraphBase):
         # Pop the special __ptr keyword argument
         ptr = kwds.pop("__ptr", None)
 
-        # Set up default values for the parameters. This should match the order
-        # in *args
-        kwd_order = (
-            "n",
-            "edges",
-            "directed",
-            "graph_attrs",
-            "vertex_attrs",
-            "edge_attrs",
-        )
-        params = [0, [], False, {}, {}, {}]
-
-        # Is there any keyword argument in kwds that we don't know? If so,
-        # freak out.
-        unknown_kwds = set(kwds.keys())
-        unknown_kwds.difference_update(kwd_order)
-        if unknown_kwds:
+        # If the first argument is a list or any other iterable, assume that
+        # the number of vertices were omitted
+        if args and hasattr(args[0], "__iter__"):
+            args = (0,) + args
+        if len(args) > 6:
             raise TypeError(
-                "{0}.__init__ got an unexpected keyword argument {1!r}".format(
-                    self.__class__.__name__, unknown_kwds.pop()
+                "{0}.__init__ takes at most 6 positional arguments ({1} given)".format(
+                    self.__class__.__name__, len(args)
                 )
             )
 
-        # If the first argument is a list or any other iterable, assume that
-        # the number of vertices were omitted
-        args = list(args)
-        if len(args) > 0 and hasattr(args[0], "__iter__"):
-            args.insert(0, params[0])
-
-        # Override default parameters from args
-        params[: len(args)] = args
-
-        # Override default parameters from keywords
-        for idx, k in enumerate(kwd_order):
-            if k in kwds:
-                params[idx] = kwds[k]
-
-        # Now, translate the params list to argument names
-        nverts, edges, directed, graph_attrs, vertex_attrs, edge_attrs = params
+        # Fill the missing positional arguments with their default values, then
+        # let the keyword arguments override them
+        nverts, edges, directed, graph_attrs, vertex_attrs, edge_attrs = (
+            args + _GRAPH_INIT_DEFAULTS[len(args) :]
+        )
+        if kwds:
+            nverts = kwds.pop("n", nverts)
+            edges = kwds.pop("edges", edges)
+            directed = kwds.pop("directed", directed)
+            graph_attrs = kwds.pop("graph_attrs", graph_attrs)
+            vertex_attrs = kwds.pop("vertex_attrs", vertex_attrs)
+            edge_attrs = kwds.pop("edge_attrs", edge_attrs)
+
+            # Is there any keyword argument in kwds that we don't know? If so,
+            # freak out.
+            if kwds:
+                raise TypeError(
+                    "{0}.__init__ got an unexpected keyword argument {1!r}".format(
+                        self.__class__.__name__, next(iter(kwds))
+                    )
+                )
 
         # When the number of vertices is None, assume that the user meant zero
         if nverts is None:
@@ -322,21 +490,13 @@ class Graph(GraphBase):
         else:
             GraphBase.__init__(self, nverts, edges, directed)
 
-        # Set the graph attributes
-        for key, value in graph_attrs.items():
-            if isinstance(key, int):
-                key = str(key)
-            self[key] = value
-        # Set the vertex attributes
-        for key, value in vertex_attrs.items():
-            if isinstance(key, int):
-                key = str(key)
-            self.vs[key] = value
-        # Set the edge attributes
-        for key, value in edge_attrs.items():
-            if isinstance(key, int):
-                key = str(key)
-            self.es[key] = value
+        # Set the graph, vertex and edge attributes
+        if graph_attrs:
+            _set_attributes(self, graph_attrs)
+        if vertex_attrs:
+            _set_attributes(self.vs, vertex_attrs)
+        if edge_attrs:
+            _set_attributes(self.es, edge_attrs)
 
     def add_edge(self, source, target, **kwds):
         """Adds a single edge to the graph.
@@ -373,7 +533,7 @@ class Graph(GraphBase):
           edges.
         """
         eid = self.ecount()
-        res = GraphBase.add_edges(self, es)
+        res = _GB_add_edges(self, es)
         n = self.ecount() - eid
         if (attributes is not None) and (n > 0):
             for key, val in list(attributes.items()):
@@ -420,7 +580,7 @@ class Graph(GraphBase):
         if isinstance(n, str):
             # Adding a single vertex with a name
             m = self.vcount()
-            result = GraphBase.add_vertices(self, 1)
+            result = _GB_add_vertices(self, 1)
             self.vs[m]["name"] = n
             if attributes is not None:
                 for key, val in list(attributes.items()):
@@ -431,14 +591,14 @@ class Graph(GraphBase):
                 names = list(n)
             else:
                 names = n
-            result = GraphBase.add_vertices(self, len(names))
+            result = _GB_add_vertices(self, len(names))
             if len(names) > 0:
                 self.vs[m:]["name"] = names
                 if attributes is not None:
                     for key, val in list(attributes.items()):
                         self.vs[m:][key] = val
         else:
-            result = GraphBase.add_vertices(self, n)
+            result = _GB_add_vertices(self, n)
             if (attributes is not None) and (n > 0):
                 m = self.vcount() - n
                 for key, val in list(attributes.items()):
@@ -482,14 +642,21 @@ class Graph(GraphBase):
         @deprecated: C{delete_edges(None)} has been replaced by
         C{delete_edges()} - with no arguments - since igraph 0.8.3.
         """
-        if len(args) == 0 and len(kwds) == 0:
-            return GraphBase.delete_edges(self)
+        if not kwds:
+            if not args:
+                return _GB_delete_edges(self)
 
-        if len(kwds) > 0 or (callable(args[0]) and not isinstance(args[0], EdgeSeq)):
+            # Fast path for the most common argument types, none of which
+            # can be callable
+            arg_type = type(args[0])
+            if arg_type in (list, int, tuple) or args[0] is None:
+                return _GB_delete_edges(self, args[0])
+
+        if kwds or (callable(args[0]) and not isinstance(args[0], EdgeSeq)):
             edge_seq = self.es(*args, **kwds)
         else:
             edge_seq = args[0]
-        return GraphBase.delete_edges(self, edge_seq)
+        return _GB_delete_edges(self, edge_seq)
 
     def indegree(self, *args, **kwds):
         """Returns the in-degrees in a list.
@@ -525,7 +692,7 @@ class Graph(GraphBase):
         """
         return [
             Cut(self, cut=cut, partition=part)
-            for cut, part in zip(*GraphBase.all_st_cuts(self, source, target))
+            for cut, part in zip(*_GB_all_st_cuts(self, source, target))
         ]
 
     def all_st_mincuts(self, source, target, capacity=None):
@@ -546,7 +713,7 @@ class Graph(GraphBase):
         @ref: JS Provan and DR Shier: A paradigm for listing (s,t)-cuts in
           graphs. Algorithmica 15, 351--372, 1996.
         """
-        value, cuts, parts = GraphBase.all_st_mincuts(self, source, target, capacity)
+        value, cuts, parts = _GB_all_st_mincuts(self, source, target, capacity)
         return [
             Cut(self, value, cut=cut, partition=part) for cut, part in zip(cuts, parts)
         ]
@@ -561,18 +728,42 @@ class Graph(GraphBase):
           and optionally the list of articulation points as well
         """
         if return_articulation_points:
-            trees, aps = GraphBase.biconnected_components(self, True)
+            trees, aps = _GB_biconnected_components(self, True)
         else:
-            trees = GraphBase.biconnected_components(self, False)
+            trees = _GB_biconnected_components(self, False)
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
 
         clusters = []
         if trees:
             edgelist = self.get_edgelist()
-            for tree in trees:
-                cluster = set()
-                for edge_id in tree:
-                    cluster.update(edgelist[edge_id])
-                clusters.append(sorted(cluster))
+            if np is not None:
+                # Look up the endpoints of all the edges of a component in
+                # one go instead of iterating over the edge IDs in Python
+                edgelist = np.array(edgelist, dtype=np.intp)
+                n = self.vcount()
+                mask = np.zeros(n, dtype=bool)
+                for tree in trees:
+                    endpoints = edgelist[tree].ravel()
+                    if len(endpoints) * 4 < n:
+                        # Small component; sorting the endpoints is cheaper
+                        # than scanning the whole vertex mask
+                        clusters.append(np.unique(endpoints).tolist())
+                    else:
+                        # Large component; mark its vertices in a reusable
+                        # boolean mask and clear only the touched entries
+                        mask[endpoints] = True
+                        clusters.append(np.flatnonzero(mask).tolist())
+                        mask[endpoints] = False
+            else:
+                for tree in trees:
+                    cluster = set()
+                    for edge_id in tree:
+                        cluster.update(edgelist[edge_id])
+                    clusters.append(sorted(cluster))
 
         clustering = VertexCover(self, clusters)
 
@@ -608,7 +799,7 @@ class Graph(GraphBase):
           L{CohesiveBlocks} for more information.
         @see: L{CohesiveBlocks}
         """
-        return CohesiveBlocks(self, *GraphBase.cohesive_blocks(self))
+        return CohesiveBlocks(self, *_GB_cohesive_blocks(self))
 
     def clusters(self, mode="strong"):
         """Calculates the (strong or weak) clusters (connected components) for
@@ -617,7 +808,7 @@ class Graph(GraphBase):
         @param mode: must be either C{"strong"} or C{"weak"}, depending on the
           clusters being sought. Optional, defaults to C{"strong"}.
         @return: a L{VertexClustering} object"""
-        return VertexClustering(self, GraphBase.clusters(self, mode))
+        return VertexClustering(self, _GB_clusters(self, mode))
 
     components = clusters
 
@@ -630,7 +821,29 @@ class Graph(GraphBase):
         @return: a histogram representing the degree distribution of the
           graph.
         """
-        result = Histogram(bin_width, self.degree(*args, **kwds))
+        degrees = self.degree(*args, **kwds)
+        if isinstance(degrees, int):
+            degrees = [degrees]
+
+        result = Histogram(bin_width)
+        if not degrees:
+            return result
+
+        # Count the occurrences of each degree first so the histogram has to
+        # process each distinct degree only once
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None:
+            counts = np.bincount(np.array(degrees, dtype=np.intp)).tolist()
+        else:
+            counts = [0] * (max(degrees) + 1)
+            for degree in degrees:
+                counts[degree] += 1
+
+        result.add_counts(counts)
         return result
 
     def dyad_census(self, *args, **kwds):
@@ -648,7 +861,7 @@ class Graph(GraphBase):
           Structure in Sociometric Data.  American Journal of Sociology, 70,
           492-513.
         """
-        return DyadCensus(GraphBase.dyad_census(self, *args, **kwds))
+        return DyadCensus(_GB_dyad_census(self, *args, **kwds))
 
     def get_adjacency(
         self, type=GET_ADJACENCY_BOTH, attribute=None, default=0, eids=False
@@ -688,34 +901,79 @@ class Graph(GraphBase):
                 type = GET_ADJACENCY_BOTH
 
         if eids:
-            result = Matrix(GraphBase.get_adjacency(self, type, eids))
+            result = Matrix(_GB_get_adjacency(self, type, eids))
             result -= 1
             return result
 
         if attribute is None:
-            return Matrix(GraphBase.get_adjacency(self, type))
+            return Matrix(_GB_get_adjacency(self, type))
 
         if attribute not in self.es.attribute_names():
             raise ValueError("Attribute does not exist")
 
-        data = [[default] * self.vcount() for _ in range(self.vcount())]
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        n = self.vcount()
+        if self.ecount() == 0:
+            return Matrix.Fill(default, n)
+
+        edges = self.get_edgelist()
+        values = self.es[attribute]
+
+        vals = None
+        if np is not None:
+            # Scatter all the attribute values into the matrix with a single
+            # fancy-indexed store. The matrix uses an object dtype so the
+            # values (and the default) are kept exactly as they were given.
+            vals = np.empty(len(values), dtype=object)
+            try:
+                vals[:] = values
+            except ValueError:
+                # Sequence-like attribute values cannot be broadcast into a
+                # flat object array; use the pure Python implementation
+                vals = None
+
+        if vals is not None:
+            data = np.empty((n, n), dtype=object)
+            data.fill(default)
+            sources, targets = np.array(edges, dtype=np.intp).T
+
+            if self.is_directed():
+                data[sources, targets] = vals
+            elif type == GET_ADJACENCY_BOTH:
+                data[sources, targets] = vals
+                data[targets, sources] = vals
+            else:
+                lower = np.minimum(sources, targets)
+                upper = np.maximum(sources, targets)
+                if type == GET_ADJACENCY_UPPER:
+                    data[lower, upper] = vals
+                else:
+                    data[upper, lower] = vals
+
+            return Matrix(data)
+
+        row = [default] * n
+        data = [row[:] for _ in range(n)]
 
         if self.is_directed():
-            for edge in self.es:
-                data[edge.source][edge.target] = edge[attribute]
+            for (source, target), value in zip(edges, values):
+                data[source][target] = value
             return Matrix(data)
 
         if type == GET_ADJACENCY_BOTH:
-            for edge in self.es:
-                source, target = edge.tuple
-                data[source][target] = edge[attribute]
-                data[target][source] = edge[attribute]
+            for (source, target), value in zip(edges, values):
+                data[source][target] = value
+                data[target][source] = value
         elif type == GET_ADJACENCY_UPPER:
-            for edge in self.es:
-                data[min(edge.tuple)][max(edge.tuple)] = edge[attribute]
+            for (source, target), value in zip(edges, values):
+                data[min(source, target)][max(source, target)] = value
         else:
-            for edge in self.es:
-                data[max(edge.tuple)][min(edge.tuple)] = edge[attribute]
+            for (source, target), value in zip(edges, values):
+                data[max(source, target)][min(source, target)] = value
 
         return Matrix(data)
 
@@ -764,7 +1022,7 @@ class Graph(GraphBase):
           the predecessors and the successors will be returned. Ignored
           for undirected graphs.
         """
-        return [self.neighbors(idx, mode) for idx in range(self.vcount())]
+        return self._get_adjlist(mode)
 
     def get_all_simple_paths(self, v, to=None, cutoff=-1, mode="out"):
         """Calculates all the simple paths from a given node to some other nodes
@@ -792,12 +1050,15 @@ class Graph(GraphBase):
           the vertices in a path are returned in reversed order!
         """
         paths = self._get_all_simple_paths(v, to, cutoff, mode)
-        prev = 0
+
+        # Paths are separated by -1 markers; let list.index() find them
+        # instead of inspecting every item in Python
         result = []
-        for index, item in enumerate(paths):
-            if item < 0:
-                result.append(paths[prev:index])
-                prev = index + 1
+        start = 0
+        for _ in range(paths.count(-1)):
+            end = paths.index(-1, start)
+            result.append(paths[start:end])
+            start = end + 1
         return result
 
     def get_inclist(self, mode="out"):
@@ -813,7 +1074,7 @@ class Graph(GraphBase):
           the predecessors and the successors will be returned. Ignored
           for undirected graphs.
         """
-        return [self.incident(idx, mode) for idx in range(self.vcount())]
+        return self._get_inclist(mode)
 
     def gomory_hu_tree(self, capacity=None, flow="flow"):
         """Calculates the Gomory-Hu tree of an undirected graph with optional
@@ -834,7 +1095,7 @@ class Graph(GraphBase):
           in which the flow values will be stored.
         @return: the Gomory-Hu tree as a L{Graph} object.
         """
-        graph, flow_values = GraphBase.gomory_hu_tree(self, capacity)
+        graph, flow_values = _GB_gomory_hu_tree(self, capacity)
         graph.es[flow] = flow_values
         return graph
 
@@ -875,7 +1136,7 @@ class Graph(GraphBase):
           edges have equal weight. May also be an attribute name.
         @return: a L{Flow} object describing the maximum flow
         """
-        return Flow(self, *GraphBase.maxflow(self, source, target, capacity))
+        return Flow(self, *_GB_maxflow(self, source, target, capacity))
 
     def mincut(self, source=None, target=None, capacity=None):
         """Calculates the minimum cut between the given source and target vertices
@@ -901,7 +1162,7 @@ class Graph(GraphBase):
           edges have equal weight. May also be an attribute name.
         @return: a L{Cut} object describing the minimum cut
         """
-        return Cut(self, *GraphBase.mincut(self, source, target, capacity))
+        return Cut(self, *_GB_mincut(self, source, target, capacity))
 
     def st_mincut(self, source, target, capacity=None):
         """Calculates the minimum cut between the source and target vertices in a
@@ -916,7 +1177,7 @@ class Graph(GraphBase):
           first and second partition, and the IDs of edges in the cut,
           packed in a 4-tuple
         """
-        return Cut(self, *GraphBase.st_mincut(self, source, target, capacity))
+        return Cut(self, *_GB_st_mincut(self, source, target, capacity))
 
     def modularity(self, membership, weights=None):
         """Calculates the modularity score of the graph with respect to a given
@@ -947,11 +1208,12 @@ class Graph(GraphBase):
           structure in networks. Phys Rev E 69 026113, 2004.
         """
         if isinstance(membership, VertexClustering):
-            if membership.graph != self:
+            if membership._graph is not self:
                 raise ValueError("clustering object belongs to another graph")
-            return GraphBase.modularity(self, membership.membership, weights)
-        else:
-            return GraphBase.modularity(self, membership, weights)
+            # The membership property returns a copy; the C layer only reads
+            # the list, so the internal one can be passed directly
+            membership = membership._membership
+        return _GB_modularity(self, membership, weights)
 
     def path_length_hist(self, directed=True):
         """Returns the path length histogram of the graph
@@ -964,10 +1226,9 @@ class Graph(GraphBase):
           the first one). The latter one will be of type long (and not
           a simple integer), since this can be I{very} large.
         """
-        data, unconn = GraphBase.path_length_hist(self, directed)
+        data, unconn = _GB_path_length_hist(self, directed)
         hist = Histogram(bin_width=1)
-        for i, length in enumerate(data):
-            hist.add(i + 1, length)
+        hist.add_counts(data, start=1)
         hist.unconnected = int(unconn)
         return hist
 
@@ -1046,7 +1307,7 @@ class Graph(GraphBase):
         @ref: Prim, R.C.: I{Shortest connection networks and some
           generalizations}. Bell System Technical Journal 36:1389-1401, 1957.
         """
-        result = GraphBase._spanning_tree(self, weights)
+        result = _GB_spanning_tree(self, weights)
         if return_tree:
             return self.subgraph_edges(result, delete_vertices=False)
         return result
@@ -1084,7 +1345,7 @@ class Graph(GraphBase):
           U{http://arxiv.org/abs/cond-mat/0311416}.
         """
         if weights is None:
-            return GraphBase.transitivity_avglocal_undirected(self, mode)
+            return _GB_transitivity_avglocal_undirected(self, mode)
 
         xs = self.transitivity_local_undirected(mode=mode, weights=weights)
         return sum(xs) / float(len(xs))
@@ -1099,7 +1360,7 @@ class Graph(GraphBase):
           J. Berger (Ed.), Sociological Theories in Progress, Volume 2,
           218-251. Boston: Houghton Mifflin.
         """
-        return TriadCensus(GraphBase.triad_census(self, *args, **kwds))
+        return TriadCensus(_GB_triad_census(self, *args, **kwds))
 
     # Automorphisms
     def count_automorphisms_vf2(
@@ -1166,7 +1427,7 @@ class Graph(GraphBase):
         @ref: A Clauset, MEJ Newman and C Moore: Finding community structure
           in very large networks. Phys Rev E 70, 066111 (2004).
         """
-        merges, qs = GraphBase.community_fastgreedy(self, weights)
+        merges, qs = _GB_community_fastgreedy(self, weights)
 
         # qs may be shorter than |V|-1 if we are left with a few separated
         # communities in the end; take this into account
@@ -1204,7 +1465,7 @@ class Graph(GraphBase):
           U{http://dx.doi.org/10.1140/epjst/e2010-01179-1},
           U{http://arxiv.org/abs/0906.1405}.
         """
-        membership, codelength = GraphBase.community_infomap(
+        membership, codelength = _GB_community_infomap(
             self, edge_weights, vertex_weights, trials
         )
         return VertexClustering(
@@ -1278,7 +1539,7 @@ class Graph(GraphBase):
         if arpack_options is not None:
             kwds["arpack_options"] = arpack_options
 
-        membership, _, q = GraphBase.community_leading_eigenvector(
+        membership, _, q = _GB_community_leading_eigenvector(
             self, clusters, **kwds
         )
         return VertexClustering(self, membership, modularity=q)
@@ -1317,8 +1578,9 @@ class Graph(GraphBase):
           U{http://arxiv.org/abs/0709.2938}.
         """
         if isinstance(fixed, str):
-            fixed = [bool(o) for o in self.vs[fixed]]
-        cl = GraphBase.community_label_propagation(self, weights, initial, fixed)
+            # The C layer evaluates the truth value of each item itself
+            fixed = self.vs[fixed]
+        cl = _GB_community_label_propagation(self, weights, initial, fixed)
         return VertexClustering(self, cl, modularity_params=dict(weights=weights))
 
     def community_multilevel(self, weights=None, return_levels=False):
@@ -1354,21 +1616,22 @@ class Graph(GraphBase):
         if self.is_directed():
             raise ValueError("input graph must be undirected")
 
+        modularity_params = dict(weights=weights)
+
         if return_levels:
-            levels, qs = GraphBase.community_multilevel(self, weights, True)
-            result = []
-            for level, q in zip(levels, qs):
-                result.append(
-                    VertexClustering(
-                        self, level, q, modularity_params=dict(weights=weights)
-                    )
-                )
-        else:
-            membership = GraphBase.community_multilevel(self, weights, False)
-            result = VertexClustering(
-                self, membership, modularity_params=dict(weights=weights)
-            )
-        return result
+            levels, qs = _GB_community_multilevel(self, weights, True)
+            return [
+                VertexClustering(self, level, q, modularity_params=modularity_params)
+                for level, q in zip(levels, qs)
+            ]
+
+        # The modularity of the final membership was already computed by the
+        # algorithm, so there is no need to recalculate it when the result is
+        # queried.
+        membership, q = _GB_community_multilevel(self, weights, False)
+        return VertexClustering(
+            self, membership, q, modularity_params=modularity_params
+        )
 
     def community_optimal_modularity(self, *args, **kwds):
         """Calculates the optimal modularity score of the graph and the
@@ -1383,7 +1646,7 @@ class Graph(GraphBase):
 
         @return: the calculated membership vector and the corresponding
           modularity in a tuple."""
-        membership, modularity = GraphBase.community_optimal_modularity(
+        membership, modularity = _GB_community_optimal_modularity(
             self, *args, **kwds
         )
         return VertexClustering(self, membership, modularity)
@@ -1414,7 +1677,7 @@ class Graph(GraphBase):
         @return: a L{VertexDendrogram} object, initally cut at the maximum
           modularity or at the desired number of clusters.
         """
-        merges, qs = GraphBase.community_edge_betweenness(self, directed, weights)
+        merges, qs = _GB_community_edge_betweenness(self, directed, weights)
         if qs is not None:
             qs.reverse()
         if clusters is None:
@@ -1473,7 +1736,7 @@ class Graph(GraphBase):
           with positive and negative links. Phys Rev E 80:036115 (2009).
           U{http://arxiv.org/abs/0811.2329}.
         """
-        membership = GraphBase.community_spinglass(self, *args, **kwds)
+        membership = _GB_community_spinglass(self, *args, **kwds)
         if "weights" in kwds:
             modularity_params = dict(weights=kwds["weights"])
         else:
@@ -1499,7 +1762,7 @@ class Graph(GraphBase):
         @ref: Pascal Pons, Matthieu Latapy: Computing communities in large
           networks using random walks, U{http://arxiv.org/abs/physics/0512106}.
         """
-        merges, qs = GraphBase.community_walktrap(self, weights, steps)
+        merges, qs = _GB_community_walktrap(self, weights, steps)
         qs.reverse()
         if qs:
             optimal_count = qs.index(max(qs)) + 1
@@ -1532,15 +1795,28 @@ class Graph(GraphBase):
                 except Exception:
                     indices.append(arg)
 
-        if len(indices) > 1 or hasattr(args[0], "__iter__"):
-            return_single = False
+            if len(indices) > 1 or hasattr(args[0], "__iter__"):
+                return_single = False
 
         corenesses = self.coreness()
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
         result = []
-        vidxs = range(self.vcount())
-        for idx in indices:
-            core_idxs = [vidx for vidx in vidxs if corenesses[vidx] >= idx]
-            result.append(self.subgraph(core_idxs))
+        if np is not None:
+            corenesses = np.array(corenesses, dtype=np.intp)
+            for idx in indices:
+                core_idxs = np.flatnonzero(corenesses >= idx).tolist()
+                result.append(self.subgraph(core_idxs))
+        else:
+            for idx in indices:
+                core_idxs = [
+                    vidx for vidx, coreness in enumerate(corenesses) if coreness >= idx
+                ]
+                result.append(self.subgraph(core_idxs))
 
         if return_single:
             return result[0]
@@ -1590,7 +1866,7 @@ class Graph(GraphBase):
         if objective_function.lower() not in ("cpm", "modularity"):
             raise ValueError('objective_function must be "CPM" or "modularity".')
 
-        membership = GraphBase.community_leiden(
+        membership = _GB_community_leiden(
             self,
             edge_weights=weights,
             node_weights=node_weights,
@@ -1680,25 +1956,45 @@ class Graph(GraphBase):
         @return: a L{Layout} object.
         """
         if layout is None:
-            layout = config["plotting.layout"]
-        if hasattr(layout, "__call__"):
+            layout = Configuration.instance()["plotting.layout"]
+        if callable(layout):
             method = layout
         else:
-            layout = layout.lower()
-            if layout[-3:] == "_3d":
+            method, is_3d = self._resolve_layout_name(layout)
+            if is_3d:
                 kwds["dim"] = 3
-                layout = layout[:-3]
-            elif layout[-2:] == "3d":
-                kwds["dim"] = 3
-                layout = layout[:-2]
-            method = getattr(self.__class__, self._layout_mapping[layout])
-        if not hasattr(method, "__call__"):
-            raise ValueError("layout method must be callable")
         layout = method(self, *args, **kwds)
         if not isinstance(layout, Layout):
             layout = Layout(layout)
         return layout
 
+    @classmethod
+    def _resolve_layout_name(cls, name):
+        """Returns the layout method registered under the given name in
+        L{_layout_mapping} and whether the name asks for a 3D layout.
+
+        Names are resolved and validated only once per class; the results are
+        cached in a dictionary that is private to the class so subclasses
+        overriding layout methods get their own methods.
+        """
+        cache = cls.__dict__.get("_resolved_layout_names")
+        if cache is None:
+            cache = {}
+            cls._resolved_layout_names = cache
+
+        result = cache.get(name)
+        if result is None:
+            key, is_3d = name.lower(), False
+            if key[-3:] == "_3d":
+                key, is_3d = key[:-3], True
+            elif key[-2:] == "3d":
+                key, is_3d = key[:-2], True
+            method = getattr(cls, cls._layout_mapping[key])
+            if not callable(method):
+                raise ValueError("layout method must be callable")
+            result = cache[name] = method, is_3d
+        return result
+
     def layout_auto(self, *args, **kwds):
         """Chooses and runs a suitable layout function based on simple
         topological properties of the graph.
@@ -1829,12 +2125,12 @@ class Graph(GraphBase):
         """
         if not return_extended_graph:
             return Layout(
-                GraphBase._layout_sugiyama(
+                _GB_layout_sugiyama(
                     self, layers, weights, hgap, vgap, maxiter, return_extended_graph
                 )
             )
 
-        layout, extd_graph, extd_to_orig_eids = GraphBase._layout_sugiyama(
+        layout, extd_graph, extd_to_orig_eids = _GB_layout_sugiyama(
             self, layers, weights, hgap, vgap, maxiter, return_extended_graph
         )
         extd_graph.es["_original_eid"] = extd_to_orig_eids
@@ -1864,7 +2160,7 @@ class Graph(GraphBase):
         if eps is None:
             eps = -1
 
-        matches = GraphBase._maximum_bipartite_matching(self, types, weights, eps)
+        matches = _GB_maximum_bipartite_matching(self, types, weights, eps)
         return Matching(self, matches, types=types)
 
     #############################################
@@ -1930,9 +2226,10 @@ class Graph(GraphBase):
         )
 
         # Node attributes
+        vs = graph.vs
         for v, datum in g.nodes.data():
             for key, val in list(datum.items()):
-                graph.vs[vd[v]][key] = val
+                vs[vd[v]][key] = val
 
         # Edges and edge attributes
         eattr_names = {name for (_, _, data) in g.edges.data() for name in data}
@@ -1996,8 +2293,9 @@ class Graph(GraphBase):
                 # Create a new vertex property
                 g.vertex_properties[x] = g.new_vertex_property(str(dtype))
                 # Fill the values from the igraph.Graph
-                for i in range(vc):
-                    g.vertex_properties[x][g.vertex(i)] = self.vs[i][x]
+                prop = g.vertex_properties[x]
+                for i, value in enumerate(self.vs.get_attribute_values(x)):
+                    prop[g.vertex(i)] = value
 
         # Edges and edge attributes
         if edge_attributes is not None:
@@ -2028,10 +2326,11 @@ class Graph(GraphBase):
         graph = cls(n=vcount, directed=g.is_directed(), graph_attrs=gattr)
 
         # Node attributes
+        vs = graph.vs
         for key, val in g.vertex_properties.items():
             prop = val.get_array()
             for i in range(vcount):
-                graph.vs[i][key] = prop[i]
+                vs[i][key] = prop[i]
 
         # Edges and edge attributes
         # NOTE: graph-tool is quite strongly typed, so each property is always
@@ -2061,12 +2360,12 @@ class Graph(GraphBase):
           note that igraph is able to read back the written adjacency matrix
           if and only if this is a single newline character
         """
-        if isinstance(f, str):
-            f = open(f, "w")
+        if isinstance(f, (str, os.PathLike)):
+            # The rows are terminated with eol exactly as given, so there is
+            # no need for newline translation
+            f = open(f, "w", newline="")
         matrix = self.get_adjacency(*args, **kwds)
-        for row in matrix:
-            f.write(sep.join(map(str, row)))
-            f.write(eol)
+        f.writelines(sep.join(map(str, row)) + eol for row in matrix)
         f.close()
 
     @classmethod
@@ -2088,21 +2387,48 @@ class Graph(GraphBase):
           no weights are stored, values larger than 1 are considered as
           edge multiplicities.
         @return: the created graph"""
-        if isinstance(f, str):
+        if isinstance(f, (str, os.PathLike)):
             f = open(f)
 
-        matrix, ri = [], 0
-        for line in f:
-            line = line.strip()
-            if len(line) == 0:
-                continue
-            if line.startswith(comment_char):
-                continue
-            row = [float(x) for x in line.split(sep)]
-            matrix.append(row)
-            ri += 1
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None:
+            # Let NumPy tokenize and parse the whole matrix; it warns about
+            # empty input, which is simply an empty graph for us
+            with catch_warnings():
+                simplefilter("ignore", UserWarning)
+                matrix = np.loadtxt(f, comments=comment_char, delimiter=sep, ndmin=2)
+            f.close()
 
-        f.close()
+            # Directed graphs from matrices that are mostly zeros are built
+            # from the nonzero entries directly
+            nrows, ncols = matrix.shape
+            if (
+                nrows == ncols
+                and len(args) <= 1
+                and set(kwds) <= {"mode", "loops"}
+                and np.count_nonzero(matrix) * 10 < matrix.size
+            ):
+                mode = kwds.get("mode", args[0] if args else "directed")
+                if _convert_mode_argument(mode) == "directed":
+                    return _graph_from_sparse_ndarray(
+                        cls, matrix, attr=attribute, loops=kwds.get("loops", True)
+                    )
+
+            matrix = matrix.tolist()
+        else:
+            matrix = []
+            for line in f:
+                line = line.strip()
+                if len(line) == 0:
+                    continue
+                if line.startswith(comment_char):
+                    continue
+                matrix.append([float(x) for x in line.split(sep)])
+            f.close()
 
         if attribute is None:
             graph = cls.Adjacency(matrix, *args, **kwds)
@@ -2244,7 +2570,7 @@ class Graph(GraphBase):
             warn("'%s' edge attribute does not exist" % capacity)
             capacity = [1] * self.ecount()
 
-        return GraphBase.write_dimacs(self, f, source, target, capacity)
+        return _GB_write_dimacs(self, f, source, target, capacity)
 
     def write_graphmlz(self, f, compresslevel=9):
         """Writes the graph to a zipped GraphML file.
@@ -2264,9 +2590,9 @@ class Graph(GraphBase):
           the most compression."""
         with named_temporary_file() as tmpfile:
             self.write_graphml(tmpfile)
-            outf = gzip.GzipFile(f, "wb", compresslevel)
-            copyfileobj(open(tmpfile, "rb"), outf)
-            outf.close()
+            with open(tmpfile, "rb") as inf:
+                with gzip.GzipFile(f, "wb", compresslevel) as outf:
+                    copyfileobj(inf, outf, _COPY_BUFFER_SIZE)
 
     @classmethod
     def Read_DIMACS(cls, f, directed=False):
@@ -2310,8 +2636,9 @@ class Graph(GraphBase):
           specify 0 here.
         @return: the loaded graph object"""
         with named_temporary_file() as tmpfile:
-            with open(tmpfile, "wb") as outf:
-                copyfileobj(gzip.GzipFile(f, "rb"), outf)
+            with gzip.GzipFile(f, "rb") as inf:
+                with open(tmpfile, "wb") as outf:
+                    copyfileobj(inf, outf, _COPY_BUFFER_SIZE)
             return cls.Read_GraphML(tmpfile, index=index)
 
     def write_pickle(self, fname=None, version=-1):
@@ -2383,6 +2710,11 @@ class Graph(GraphBase):
         if hasattr(fname, "read"):
             # Probably a file or a file-like object
             result = pickle.load(fname)
+        elif isinstance(fname, (bytes, bytearray)) and fname[:1] == pickle.PROTO:
+            # Pickled data of protocol 2 or above; no need to look for a file
+            # with this name. Such data may also contain null bytes that
+            # open() would reject with a ValueError
+            result = pickle.loads(fname)
         else:
             try:
                 fp = open(fname, "rb")
@@ -2558,6 +2890,10 @@ class Graph(GraphBase):
             f = fname
             our_file = False
 
+        from igraph.drawing import BoundingBox
+
+        if not isinstance(layout, Layout):
+            layout = Layout(layout)
         bbox = BoundingBox(layout.bounding_box())
 
         sizes = [width - 2 * vertex_size, height - 2 * vertex_size]
@@ -2573,36 +2909,48 @@ class Graph(GraphBase):
         else:
             ratios.append(sizes[1] / h)
 
-        layout = [
-            [
-                (row[0] - bbox.left) * ratios[0] + vertex_size,
-                (row[1] - bbox.top) * ratios[1] + vertex_size,
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None and len(layout):
+            coords = np.array(layout.coords, dtype=float)[:, :2]
+            coords -= (bbox.left, bbox.top)
+            coords *= ratios
+            coords += vertex_size
+            layout = coords.tolist()
+        else:
+            coords = None
+            layout = [
+                [
+                    (row[0] - bbox.left) * ratios[0] + vertex_size,
+                    (row[1] - bbox.top) * ratios[1] + vertex_size,
+                ]
+                for row in layout
             ]
-            for row in layout
-        ]
 
         directed = self.is_directed()
 
-        print('<?xml version="1.0" encoding="UTF-8" standalone="no"?>', file=f)
-        print(
-            "<!-- Created by igraph (http://igraph.org/) -->",
-            file=f,
-        )
-        print(file=f)
-        print(
+        # The file is assembled in memory and written with a single call
+        lines = []
+        lines.append('<?xml version="1.0" encoding="UTF-8" standalone="no"?>')
+        lines.append("<!-- Created by igraph (http://igraph.org/) -->")
+        lines.append("")
+        lines.append(
             '<svg xmlns:dc="http://purl.org/dc/elements/1.1/" '
             'xmlns:cc="http://creativecommons.org/ns#" '
             'xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
             'xmlns:svg="http://www.w3.org/2000/svg" '
             'xmlns="http://www.w3.org/2000/svg" '
             'xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd" '
-            'xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"',
-            file=f,
+            'xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"'
+        )
+        lines.append(
+            'width="{0}px" height="{1}px"> <defs id="defs3">'.format(width, height)
         )
-        print('width="{0}px" height="{1}px">'.format(width, height), end=" ", file=f)
 
         edge_color_dict = {}
-        print('<defs id="defs3">', file=f)
         for e_col in set(edge_colors):
             if e_col == "#000000":
                 marker_index = ""
@@ -2610,79 +2958,108 @@ class Graph(GraphBase):
                 marker_index = str(len(edge_color_dict))
             # Print an arrow marker for each possible line color
             # This is a copy of Inkscape's standard Arrow 2 marker
-            print("<marker", file=f)
-            print('   inkscape:stockid="Arrow2Lend{0}"'.format(marker_index), file=f)
-            print('   orient="auto"', file=f)
-            print('   refY="0.0"', file=f)
-            print('   refX="0.0"', file=f)
-            print('   id="Arrow2Lend{0}"'.format(marker_index), file=f)
-            print('   style="overflow:visible;">', file=f)
-            print("  <path", file=f)
-            print('     id="pathArrow{0}"'.format(marker_index), file=f)
-            print(
+            lines.append("<marker")
+            lines.append('   inkscape:stockid="Arrow2Lend{0}"'.format(marker_index))
+            lines.append('   orient="auto"')
+            lines.append('   refY="0.0"')
+            lines.append('   refX="0.0"')
+            lines.append('   id="Arrow2Lend{0}"'.format(marker_index))
+            lines.append('   style="overflow:visible;">')
+            lines.append("  <path")
+            lines.append('     id="pathArrow{0}"'.format(marker_index))
+            lines.append(
                 '     style="font-size:12.0;fill-rule:evenodd;'
                 'stroke-width:0.62500000;stroke-linejoin:round;'
-                'fill:{0}"'.format(e_col),
-                file=f,
+                'fill:{0}"'.format(e_col)
             )
-            print(
+            lines.append(
                 '     d="M 8.7185878,4.0337352 L -2.2072895,0.016013256 '
                 'L 8.7185884,-4.0017078 C 6.9730900,-1.6296469 '
-                '6.9831476,1.6157441 8.7185878,4.0337352 z "',
-                file=f,
+                '6.9831476,1.6157441 8.7185878,4.0337352 z "'
             )
-            print('     transform="scale(1.1) rotate(180) translate(1,0)" />', file=f)
-            print("</marker>", file=f)
+            lines.append('     transform="scale(1.1) rotate(180) translate(1,0)" />')
+            lines.append("</marker>")
 
             edge_color_dict[e_col] = "Arrow2Lend{0}".format(marker_index)
-        print("</defs>", file=f)
-        print(
+        lines.append("</defs>")
+        lines.append(
             '<g inkscape:groupmode="layer" id="layer2" inkscape:label="Lines" '
-            'sodipodi:insensitive="true">',
-            file=f,
+            'sodipodi:insensitive="true">'
+        )
+
+        # Each edge ends vertex_size units before its target vertex so the
+        # arrowheads remain visible. The endpoints are calculated for all the
+        # edges at once when NumPy is available.
+        edges = self.get_edgelist()
+        if coords is not None and edges:
+            sources, targets = np.array(edges, dtype=np.intp).T
+            x1, y1 = coords[sources].T
+            x2, y2 = coords[targets].T
+            angles = np.arctan2(y2 - y1, x2 - x1)
+            x2 = x2 - vertex_size * np.cos(angles)
+            y2 = y2 - vertex_size * np.sin(angles)
+            segments = zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist())
+        else:
+            segments = []
+            for source, target in edges:
+                x1, y1 = layout[source]
+                x2, y2 = layout[target]
+                angle = math.atan2(y2 - y1, x2 - x1)
+                x2 -= vertex_size * math.cos(angle)
+                y2 -= vertex_size * math.sin(angle)
+                segments.append((x1, y1, x2, y2))
+
+        edge_template = (
+            "<path\n"
+            '    style="fill:none;stroke:{0};stroke-width:{2};'
+            "stroke-linecap:butt;stroke-linejoin:miter;stroke-miterlimit:4;"
+            'stroke-opacity:1;stroke-dasharray:none{1}"\n'
+            '    d="M {3},{4} {5},{6}"\n'
+            '    id="path{7}"\n'
+            '    inkscape:connector-type="polyline"\n'
+            '    inkscape:connector-curvature="0"\n'
+            '    inkscape:connection-start="#g{8}"\n'
+            '    inkscape:connection-start-point="d4"\n'
+            '    inkscape:connection-end="#g{9}"\n'
+            '    inkscape:connection-end-point="d4" />'
         )
 
-        for eidx, edge in enumerate(self.es):
-            vidxs = edge.tuple
-            x1 = layout[vidxs[0]][0]
-            y1 = layout[vidxs[0]][1]
-            x2 = layout[vidxs[1]][0]
-            y2 = layout[vidxs[1]][1]
-            angle = math.atan2(y2 - y1, x2 - x1)
-            x2 -= vertex_size * math.cos(angle)
-            y2 -= vertex_size * math.sin(angle)
-
-            print("<path", file=f)
-            print(
-                '    style="fill:none;stroke:{0};stroke-width:{2};'
-                'stroke-linecap:butt;stroke-linejoin:miter;stroke-miterlimit:4;'
-                'stroke-opacity:1;stroke-dasharray:none{1}"'.format(
-                    edge_colors[eidx],
-                    ";marker-end:url(#{0})".format(edge_color_dict[edge_colors[eidx]])
-                    if directed
-                    else "",
-                    edge_stroke_widths[eidx],
-                ),
-                file=f,
+        # Arrowheads depend on the edge color only; look them up by color
+        # instead of deciding and formatting them again for every edge
+        if directed:
+            edge_markers = {
+                color: ";marker-end:url(#{0})".format(marker)
+                for color, marker in edge_color_dict.items()
+            }
+        else:
+            edge_markers = dict.fromkeys(edge_color_dict, "")
+
+        lines.extend(
+            edge_template.format(
+                edge_colors[eidx],
+                edge_markers[edge_colors[eidx]],
+                edge_stroke_widths[eidx],
+                x1,
+                y1,
+                x2,
+                y2,
+                eidx,
+                source,
+                target,
+            )
+            for eidx, ((source, target), (x1, y1, x2, y2)) in enumerate(
+                zip(edges, segments)
             )
-            print('    d="M {0},{1} {2},{3}"'.format(x1, y1, x2, y2), file=f)
-            print('    id="path{0}"'.format(eidx), file=f)
-            print('    inkscape:connector-type="polyline"', file=f)
-            print('    inkscape:connector-curvature="0"', file=f)
-            print('    inkscape:connection-start="#g{0}"'.format(edge.source), file=f)
-            print('    inkscape:connection-start-point="d4"', file=f)
-            print('    inkscape:connection-end="#g{0}"'.format(edge.target), file=f)
-            print('    inkscape:connection-end-point="d4" />', file=f)
-
-        print("  </g>", file=f)
-        print(file=f)
-
-        print(
+        )
+
+        lines.append("  </g>")
+        lines.append("")
+
+        lines.append(
             '  <g inkscape:label="Nodes" \
-                    inkscape:groupmode="layer" id="layer1">',
-            file=f,
+                    inkscape:groupmode="layer" id="layer1">'
         )
-        print("  <!-- Vertices -->", file=f)
+        lines.append("  <!-- Vertices -->")
 
         if any(x == 3 for x in shapes):
             # Only import tkFont if we really need it. Unfortunately, this will
@@ -2710,94 +3087,83 @@ class Graph(GraphBase):
         else:
             tk_window = None
 
-        for vidx in range(self.vcount()):
-            print(
-                '    <g id="g{0}" transform="translate({1},{2})">'.format(
-                    vidx, layout[vidx][0], layout[vidx][1]
-                ),
-                file=f,
-            )
-            if shapes[vidx] == 1:
+        # Everything that does not depend on the vertex itself is substituted
+        # into the vertex templates only once
+        size_str = str(vertex_size)
+        group_template = '    <g id="g{0}" transform="translate({1},{2})">'
+        circle_template = '     <circle cx="0" cy="0" r="{0}" fill="{{0}}"/>'.format(
+            size_str
+        )
+        two_color_circle_template = "\n".join(
+            [
+                '     <path d="M -{0},0 A{0},{0} 0 0,0 {0},0 L \
+                                -{0},0" fill="{{0}}"/>',
+                '     <path d="M -{0},0 A{0},{0} 0 0,1 {0},0 L \
+                                -{0},0" fill="{{1}}"/>',
+                '     <circle cx="0" cy="0" r="{0}" fill="none"/>',
+            ]
+        ).format(size_str)
+        rect_template = (
+            '      <rect x="-{0}" y="-{0}" width="{1}" height="{1}" '
+            'id="rect{{0}}" style="fill:{{1}};fill-opacity:1" />'
+        ).format(vertex_size, vertex_size * 2)
+        text_rect_template = (
+            '      <rect ry="5" rx="5" x="-{0}" y="-{1}" width="{2}" '
+            'height="{3}" id="rect{4}" style="fill:{5};fill-opacity:1" '
+            "/>"
+        )
+        label_template = (
+            '      <text sodipodi:linespacing="125%" y="{0}" x="0" '
+            'id="text{{0}}" style="font-size:{1};font-style:normal;'
+            "font-weight:normal;text-align:center;line-height:125%;"
+            "letter-spacing:0px;word-spacing:0px;text-anchor:middle;"
+            "fill:#000000;fill-opacity:1;stroke:none;"
+            'font-family:Sans">\n'
+            '<tspan y="{0}" x="0" id="tspan{{0}}" sodipodi:role="line">'
+            "{{1}}</tspan></text>\n"
+            "    </g>"
+        ).format(vertex_size / 2.0, font_size)
+
+        # The per-vertex properties are walked in lockstep instead of being
+        # indexed separately for every vertex. Missing shapes default to
+        # circles; the shapes given by the caller may be any sequence and
+        # are left intact
+        shapes = chain(shapes, repeat(1))
+        vertices = zip(range(vcount), layout, shapes, colors, map(str, labels))
+        for vidx, (x, y), shape, color, label in vertices:
+            lines.append(group_template.format(vidx, x, y))
+            if shape == 1:
                 # Undocumented feature: can handle two colors but only for circles
-                c = str(colors[vidx])
+                c = str(color)
                 if " " in c:
-                    c = c.split(" ")
-                    vs = str(vertex_size)
-                    print(
-                        '     <path d="M -{0},0 A{0},{0} 0 0,0 {0},0 L \
-                                -{0},0" fill="{1}"/>'.format(
-                            vs, c[0]
-                        ),
-                        file=f,
-                    )
-                    print(
-                        '     <path d="M -{0},0 A{0},{0} 0 0,1 {0},0 L \
-                                -{0},0" fill="{1}"/>'.format(
-                            vs, c[1]
-                        ),
-                        file=f,
-                    )
-                    print(
-                        '     <circle cx="0" cy="0" r="{0}" fill="none"/>'.format(vs),
-                        file=f,
-                    )
+                    lines.append(two_color_circle_template.format(*c.split(" ")))
                 else:
-                    print(
-                        '     <circle cx="0" cy="0" r="{0}" fill="{1}"/>'.format(
-                            str(vertex_size), str(colors[vidx])
-                        ),
-                        file=f,
-                    )
-            elif shapes[vidx] == 2:
-                print(
-                    '      <rect x="-{0}" y="-{0}" width="{1}" height="{1}" '
-                    'id="rect{2}" style="fill:{3};fill-opacity:1" />'.format(
-                        vertex_size, vertex_size * 2, vidx, colors[vidx]
-                    ),
-                    file=f,
-                )
-            elif shapes[vidx] == 3:
+                    lines.append(circle_template.format(c))
+            elif shape == 2:
+                lines.append(rect_template.format(vidx, color))
+            elif shape == 3:
                 (vertex_width, vertex_height) = (
-                    font.measure(str(labels[vidx])) + 2,
+                    font.measure(label) + 2,
                     font.metrics("linespace") + 2,
                 )
-                print(
-                    '      <rect ry="5" rx="5" x="-{0}" y="-{1}" width="{2}" '
-                    'height="{3}" id="rect{4}" style="fill:{5};fill-opacity:1" '
-                    '/>'.format(
+                lines.append(
+                    text_rect_template.format(
                         vertex_width / 2.0,
                         vertex_height / 2.0,
                         vertex_width,
                         vertex_height,
                         vidx,
-                        colors[vidx],
-                    ),
-                    file=f,
+                        color,
+                    )
                 )
 
-            print(
-                '      <text sodipodi:linespacing="125%" y="{0}" x="0" '
-                'id="text{1}" style="font-size:{2};font-style:normal;'
-                'font-weight:normal;text-align:center;line-height:125%;'
-                'letter-spacing:0px;word-spacing:0px;text-anchor:middle;'
-                'fill:#000000;fill-opacity:1;stroke:none;'
-                'font-family:Sans">'.format(
-                    vertex_size / 2.0, vidx, font_size
-                ),
-                file=f,
-            )
-            print(
-                '<tspan y="{0}" x="0" id="tspan{1}" sodipodi:role="line">'
-                '{2}</tspan></text>'.format(
-                    vertex_size / 2.0, vidx, str(labels[vidx])
-                ),
-                file=f,
-            )
-            print("    </g>", file=f)
+            lines.append(label_template.format(vidx, label))
+
+        lines.append("</g>")
+        lines.append("")
+        lines.append("</svg>")
 
-        print("</g>", file=f)
-        print(file=f)
-        print("</svg>", file=f)
+        f.write("\n".join(lines) + "\n")
 
         if our_file:
             f.close()
@@ -2840,7 +3206,7 @@ class Graph(GraphBase):
             elif ext2 == ".graphml":
                 return "graphmlz"
 
-        if ext in [
+        if ext in {
             ".dimacs",
             ".dl",
             ".dot",
@@ -2859,37 +3225,31 @@ class Graph(GraphBase):
             ".pickle",
             ".picklez",
             ".svg",
-        ]:
+        }:
             return ext[1:]
 
         if ext == ".txt" or ext == ".dat":
-            # Most probably an adjacency matrix or an edge list
-            f = open(filename, "r")
-            line = f.readline()
-            if line is None:
+            # Most probably an adjacency matrix or an edge list. Only the
+            # first three lines are needed to decide
+            with open(filename, "r") as f:
+                counts = [len(line.split()) for line in islice(f, 3)]
+
+            if not counts:
+                # Empty file
                 return "edges"
-            parts = line.strip().split()
-            if len(parts) == 2:
-                line = f.readline()
-                if line is None:
-                    return "edges"
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    line = f.readline()
-                    if line is None:
-                        # This is a 2x2 matrix, it can be a matrix or an edge
-                        # list as well and we cannot decide
-                        return None
-                    else:
-                        parts = line.strip().split()
-                        if len(parts) == 0:
-                            return None
-                    return "edges"
-                else:
-                    # Not a matrix
-                    return None
-            else:
+            if counts[0] != 2:
                 return "adjacency"
+            if len(counts) == 1:
+                # A single edge
+                return "edges"
+            if counts[1] != 2:
+                # Not a matrix
+                return None
+            if len(counts) == 2 or counts[2] == 0:
+                # This is a 2x2 matrix, it can be a matrix or an edge list as
+                # well and we cannot decide
+                return None
+            return "edges"
 
     @classmethod
     def Read(cls, f, format=None, *args, **kwds):
@@ -3035,24 +3395,30 @@ class Graph(GraphBase):
         @return: the graph that was constructed
         """
 
-        def create_list_from_indices(indices, n):
-            result = [None] * n
-            for i, v in indices:
-                result[i] = v
-            return result
+        def add_to_columns(columns, idx, data):
+            # Appends the values of row idx to the attribute columns. Columns
+            # are padded with None lazily, only when a key is missing from
+            # some of the rows
+            for k, v in data.items():
+                column = columns.get(k)
+                if column is None:
+                    column = columns[k] = [None] * idx
+                elif len(column) < idx:
+                    column.extend([None] * (idx - len(column)))
+                column.append(v)
+
+        def pad_columns(columns, n):
+            for column in columns.values():
+                if len(column) < n:
+                    column.extend([None] * (n - len(column)))
 
         # Construct the vertices
         vertex_attrs, n = {}, 0
         if vertices:
             for idx, vertex_data in enumerate(vertices):
-                for k, v in vertex_data.items():
-                    try:
-                        vertex_attrs[k].append((idx, v))
-                    except KeyError:
-                        vertex_attrs[k] = [(idx, v)]
+                add_to_columns(vertex_attrs, idx, vertex_data)
                 n += 1
-            for k, v in vertex_attrs.items():
-                vertex_attrs[k] = create_list_from_indices(v, n)
+            pad_columns(vertex_attrs, n)
         else:
             vertex_attrs[vertex_name_attr] = []
 
@@ -3067,38 +3433,48 @@ class Graph(GraphBase):
         efk_src, efk_dest = edge_foreign_keys
         if iterative:
             g = cls(n, [], directed, {}, vertex_attrs)
+            # The sequences are views of the whole graph, so they can be
+            # reused while vertices and edges are being added
+            vs, es = g.vs, g.es
             for idx, edge_data in enumerate(edges):
                 src_name, dst_name = edge_data[efk_src], edge_data[efk_dest]
                 v1 = vertex_name_map[src_name]
                 if v1 == n:
                     g.add_vertices(1)
-                    g.vs[n][vertex_name_attr] = src_name
+                    vs[n][vertex_name_attr] = src_name
                     n += 1
                 v2 = vertex_name_map[dst_name]
                 if v2 == n:
                     g.add_vertices(1)
-                    g.vs[n][vertex_name_attr] = dst_name
+                    vs[n][vertex_name_attr] = dst_name
                     n += 1
                 g.add_edge(v1, v2)
+                edge = es[idx]
                 for k, v in edge_data.items():
-                    g.es[idx][k] = v
+                    edge[k] = v
 
             return g
         else:
-            edge_list, edge_attrs, m = [], {}, 0
-            for idx, edge_data in enumerate(edges):
-                v1 = vertex_name_map[edge_data[efk_src]]
-                v2 = vertex_name_map[edge_data[efk_dest]]
+            edges = list(edges)
+            m = len(edges)
+
+            # Endpoints are resolved in a single pass in source, target order
+            # so unknown names receive their IDs in order of appearance
+            endpoints = list(
+                map(
+                    vertex_name_map.__getitem__,
+                    chain.from_iterable(
+                        (edge_data[efk_src], edge_data[efk_dest])
+                        for edge_data in edges
+                    ),
+                )
+            )
+            edge_list = list(zip(endpoints[::2], endpoints[1::2]))
 
-                edge_list.append((v1, v2))
-                for k, v in edge_data.items():
-                    try:
-                        edge_attrs[k].append((idx, v))
-                    except KeyError:
-                        edge_attrs[k] = [(idx, v)]
-                m += 1
-            for k, v in edge_attrs.items():
-                edge_attrs[k] = create_list_from_indices(v, m)
+            edge_attrs = {}
+            for idx, edge_data in enumerate(edges):
+                add_to_columns(edge_attrs, idx, edge_data)
+            pad_columns(edge_attrs, m)
 
             # It may have happened that some vertices were added during
             # the process
@@ -3106,8 +3482,11 @@ class Graph(GraphBase):
                 diff = len(vertex_name_map) - n
                 more = [None] * diff
                 for k, v in vertex_attrs.items():
-                    v.extend(more)
-                vertex_attrs[vertex_name_attr] = list(vertex_name_map.values())
+                    if k != vertex_name_attr:
+                        v.extend(more)
+                # Names are inserted into the generator in the order of their
+                # IDs, so the new names are exactly the ones after the first n
+                vertex_names.extend(islice(vertex_name_map._ids, n, None))
                 n = len(vertex_name_map)
 
             # Create the graph
@@ -3257,7 +3636,11 @@ class Graph(GraphBase):
           stores the vertex classes.
         """
         result = cls._Bipartite(types, edges, directed, *args, **kwds)
-        result.vs["type"] = [bool(x) for x in types]
+        if getattr(types, "dtype", None) == bool:
+            # Boolean NumPy arrays convert to a list of bools in one call
+            result.vs["type"] = types.tolist()
+        else:
+            result.vs["type"] = list(map(bool, types))
         return result
 
     @classmethod
@@ -3776,7 +4159,8 @@ class Graph(GraphBase):
         """
         if isinstance(other, (int, str)):
             g = self.copy()
-            g.add_vertices(other)
+            if other != 0:
+                g.add_vertices(other)
         elif isinstance(other, tuple) and len(other) == 2:
             g = self.copy()
             g.add_edges([other])
@@ -3854,32 +4238,33 @@ class Graph(GraphBase):
         if isinstance(other, Graph):
             return self.difference(other)
 
-        result = self.copy()
+        # Decide what to delete before copying the graph so unsupported
+        # operands do not pay for a copy that is thrown away
         if isinstance(other, (int, str)):
-            result.delete_vertices([other])
+            other, vertices = [other], True
         elif isinstance(other, tuple) and len(other) == 2:
-            result.delete_edges([other])
+            other, vertices = [other], False
         elif isinstance(other, list):
-            if len(other) > 0:
-                if isinstance(other[0], tuple):
-                    result.delete_edges(other)
-                elif isinstance(other[0], (int, str)):
-                    result.delete_vertices(other)
-                else:
-                    return NotImplemented
+            if not other:
+                return self.copy()
+            if isinstance(other[0], tuple):
+                vertices = False
+            elif isinstance(other[0], (int, str)):
+                vertices = True
             else:
-                return result
-        elif isinstance(other, Vertex):
-            result.delete_vertices(other)
-        elif isinstance(other, VertexSeq):
-            result.delete_vertices(other)
-        elif isinstance(other, Edge):
-            result.delete_edges(other)
-        elif isinstance(other, EdgeSeq):
-            result.delete_edges(other)
+                return NotImplemented
+        elif isinstance(other, (Vertex, VertexSeq)):
+            vertices = True
+        elif isinstance(other, (Edge, EdgeSeq)):
+            vertices = False
         else:
             return NotImplemented
 
+        result = self.copy()
+        if vertices:
+            result.delete_vertices(other)
+        else:
+            result.delete_edges(other)
         return result
 
     def __mul__(self, other):
@@ -3888,7 +4273,7 @@ class Graph(GraphBase):
 
         @param other: if it is an integer, multiplies the graph by creating the
           given number of identical copies and taking the disjoint union of
-          them.
+          them. Multiplying by one returns the graph itself, not a copy.
         """
         if isinstance(other, int):
             if other == 0:
@@ -3948,13 +4333,10 @@ class Graph(GraphBase):
     def __reduce__(self):
         """Support for pickling."""
         constructor = self.__class__
-        gattrs, vattrs, eattrs = {}, {}, {}
-        for attr in self.attributes():
-            gattrs[attr] = self[attr]
-        for attr in self.vs.attribute_names():
-            vattrs[attr] = self.vs[attr]
-        for attr in self.es.attribute_names():
-            eattrs[attr] = self.es[attr]
+        vs, es = self.vs, self.es
+        gattrs = {attr: self[attr] for attr in self.attributes()}
+        vattrs = {attr: vs.get_attribute_values(attr) for attr in vs.attribute_names()}
+        eattrs = {attr: es.get_attribute_values(attr) for attr in es.attribute_names()}
         parameters = (
             self.vcount(),
             self.get_edgelist(),
@@ -4159,6 +4541,8 @@ class Graph(GraphBase):
             specifies whether the order is reversed (C{True}, C{False},
             C{"asc"} and C{"desc"} are accepted values).
         """
+        from igraph.drawing import DefaultGraphDrawer
+
         drawer_factory = kwds.get("drawer_factory", DefaultGraphDrawer)
         if "drawer_factory" in kwds:
             del kwds["drawer_factory"]
@@ -4513,53 +4897,63 @@ class VertexSeq(_VertexSeq):
           >>> g = Graph.Famous("zachary")
           >>> non_isolated = g.vs.select(_degree_gt=0)
 
-        For properties that take a long time to be computed (e.g., betweenness
-        centrality for large graphs), it is advised to calculate the values
-        in advance and store it in a graph attribute. The same applies when
-        you are selecting based on the same property more than once in the
-        same C{select()} call to avoid calculating it twice unnecessarily.
-        For instance, the following would calculate betweenness centralities
-        twice:
+        Attributes and properties that are used by more than one keyword
+        argument in the same C{select()} call are retrieved only once, so
+        the following calculates betweenness centralities only once:
 
           >>> edges = g.vs.select(_betweenness_gt=10, _betweenness_lt=30)
 
-        It is advised to use this instead:
+        For properties that take a long time to be computed (e.g., betweenness
+        centrality for large graphs) and that are used in several C{select()}
+        calls, it is still advised to calculate the values in advance and
+        store them in a graph attribute:
 
           >>> g.vs["bs"] = g.betweenness()
           >>> edges = g.vs.select(bs_gt=10, bs_lt=30)
 
         @return: the new, filtered vertex sequence"""
-        vs = _VertexSeq.select(self, *args)
-
-        operators = {
-            "lt": operator.lt,
-            "gt": operator.gt,
-            "le": operator.le,
-            "ge": operator.ge,
-            "eq": operator.eq,
-            "ne": operator.ne,
-            "in": lambda a, b: a in b,
-            "notin": lambda a, b: a not in b,
-        }
+        # Positional arguments are resolved by the C layer; without them the
+        # keyword filters can work on this sequence directly as the final
+        # select() call creates the new sequence anyway
+        vs = _VertexSeq.select(self, *args) if args or not kwds else self
+
+        # Positions of the vertices in vs that passed all the filters so far;
+        # None means all of them. The filters narrow down this list and the
+        # sequence is selected only once at the end
+        positions = None
+        # Attribute values and method results that were already retrieved,
+        # keyed by the name of the attribute or method. Each of them is a list
+        # indexed by position in vs, or a dict from position to value if it was
+        # evaluated on the remaining vertices only; as the positions only ever
+        # shrink, both cover all the positions that later filters look at
+        columns = {}
         for keyword, value in kwds.items():
-            if "_" not in keyword or keyword.rindex("_") == 0:
-                keyword += "_eq"
-            attr, _, op = keyword.rpartition("_")
-            try:
-                func = operators[op]
-            except KeyError:
-                # No such operator, assume that it's part of the attribute name
-                attr, op, func = keyword, "eq", operators["eq"]
-
-            if attr[0] == "_":
-                # Method call, not an attribute
-                values = getattr(vs.graph, attr[1:])(vs)
+            attr, op, func = _parse_select_keyword(keyword)
+            if op == "in" or op == "notin":
+                value = _select_lookup_values(value)
+
+            values = columns.get(attr)
+            if values is None:
+                if attr[0] != "_":
+                    values = columns[attr] = vs[attr]
+                elif positions is None:
+                    # Method call, not an attribute
+                    values = columns[attr] = getattr(vs.graph, attr[1:])(vs)
+                else:
+                    # Method call, evaluated on the remaining vertices only
+                    values = getattr(vs.graph, attr[1:])(vs.select(positions))
+                    values = columns[attr] = dict(zip(positions, values))
+
+            if positions is None:
+                positions = _select_numeric(values, op, value)
+                if positions is not None:
+                    continue
+                candidates = enumerate(values)
             else:
-                values = vs[attr]
-            filtered_idxs = [i for i, v in enumerate(values) if func(v, value)]
-            vs = vs.select(filtered_idxs)
+                candidates = ((i, values[i]) for i in positions)
+            positions = [i for i, v in candidates if func(v, value)]
 
-        return vs
+        return vs if positions is None else vs.select(positions)
 
     def __call__(self, *args, **kwds):
         """Shorthand notation to select()
@@ -4800,25 +5194,27 @@ class EdgeSeq(_EdgeSeq):
 
           >>> edges = g.es.select(_between = ([2, 3, 4, 7], [8, 9]))
 
-        For properties that take a long time to be computed (e.g., betweenness
-        centrality for large graphs), it is advised to calculate the values
-        in advance and store it in a graph attribute. The same applies when
-        you are selecting based on the same property more than once in the
-        same C{select()} call to avoid calculating it twice unnecessarily.
-        For instance, the following would calculate betweenness centralities
-        twice:
+        Attributes and properties that are used by more than one keyword
+        argument in the same C{select()} call are retrieved only once, so
+        the following calculates betweenness centralities only once:
 
           >>> edges = g.es.select(_edge_betweenness_gt=10,       # doctest:+SKIP
           ...                     _edge_betweenness_lt=30)
 
-        It is advised to use this instead:
+        For properties that take a long time to be computed (e.g., betweenness
+        centrality for large graphs) and that are used in several C{select()}
+        calls, it is still advised to calculate the values in advance and
+        store them in a graph attribute:
 
           >>> g.es["bs"] = g.edge_betweenness()
           >>> edges = g.es.select(bs_gt=10, bs_lt=30)
 
         @return: the new, filtered edge sequence
         """
-        es = _EdgeSeq.select(self, *args)
+        # Positional arguments are resolved by the C layer; without them the
+        # keyword filters can work on this sequence directly as the final
+        # select() call creates the new sequence anyway
+        es = _EdgeSeq.select(self, *args) if args or not kwds else self
         is_directed = self.graph.is_directed()
 
         def _ensure_set(value):
@@ -4828,16 +5224,26 @@ class EdgeSeq(_EdgeSeq):
                 value = set(value)
             return value
 
-        operators = {
-            "lt": operator.lt,
-            "gt": operator.gt,
-            "le": operator.le,
-            "ge": operator.ge,
-            "eq": operator.eq,
-            "ne": operator.ne,
-            "in": lambda a, b: a in b,
-            "notin": lambda a, b: a not in b,
-        }
+        # The edge list of the graph is fetched at most once per call, and only
+        # if one of the endpoint-based filters needs it
+        edgelist = None
+
+        def _get_edgelist():
+            nonlocal edgelist
+            if edgelist is None:
+                edgelist = es.graph.get_edgelist()
+            return edgelist
+
+        # Positions of the edges in es that passed all the filters so far;
+        # None means all of them. The filters narrow down this list and the
+        # sequence is selected only once at the end
+        positions = None
+        # Attribute values and method results that were already retrieved,
+        # keyed by the name of the attribute or method. Each of them is a list
+        # indexed by position in es, or a dict from position to value if it was
+        # evaluated on the remaining edges only; as the positions only ever
+        # shrink, both cover all the positions that later filters look at
+        columns = {}
 
         # TODO(ntamas): some keyword arguments should be prioritized over
         # others; for instance, we have optimized code paths for _source and
@@ -4846,50 +5252,49 @@ class EdgeSeq(_EdgeSeq):
         # multiple keyword arguments and es.is_all() is True.
 
         for keyword, value in kwds.items():
-            if "_" not in keyword or keyword.rindex("_") == 0:
-                keyword += "_eq"
-            pos = keyword.rindex("_")
-            attr, op = keyword[0:pos], keyword[pos + 1 :]
-            try:
-                func = operators[op]
-            except KeyError:
-                # No such operator, assume that it's part of the attribute name
-                attr, op, func = keyword, "eq", operators["eq"]
+            attr, op, func = _parse_select_keyword(keyword)
+            if op == "in" or op == "notin":
+                value = _select_lookup_values(value)
 
             if attr[0] == "_":
+                # Special properties are evaluated on the edges that are
+                # still selected
+                cur = es if positions is None else es.select(positions)
                 if attr in ("_source", "_from", "_target", "_to") and not is_directed:
                     if op not in ("eq", "in"):
                         raise RuntimeError("unsupported for undirected graphs")
 
                     # translate to _incident to avoid confusion
                     attr = "_incident"
-                    if func == operators["eq"]:
+                    if func == _SELECT_OPERATORS["eq"]:
                         if hasattr(value, "__iter__") and not isinstance(value, str):
                             value = set(value)
                         else:
                             value = set([value])
 
                 if attr in ("_source", "_from"):
-                    if es.is_all() and op == "eq":
+                    if cur.is_all() and op == "eq":
                         # shortcut here: use .incident() as it is much faster
                         filtered_idxs = sorted(es.graph.incident(value, mode="out"))
                         func = None
                         # TODO(ntamas): there are more possibilities; we could
                         # optimize "ne", "in" and "notin" in similar ways
                     else:
-                        values = [e.source for e in es]
+                        endpoints = _get_edgelist()
+                        values = [endpoints[i][0] for i in cur.indices]
                         if op == "in" or op == "notin":
                             value = _ensure_set(value)
 
                 elif attr in ("_target", "_to"):
-                    if es.is_all() and op == "eq":
+                    if cur.is_all() and op == "eq":
                         # shortcut here: use .incident() as it is much faster
                         filtered_idxs = sorted(es.graph.incident(value, mode="in"))
                         func = None
                         # TODO(ntamas): there are more possibilities; we could
                         # optimize "ne", "in" and "notin" in similar ways
                     else:
-                        values = [e.target for e in es]
+                        endpoints = _get_edgelist()
+                        values = [endpoints[i][1] for i in cur.indices]
                         if op == "in" or op == "notin":
                             value = _ensure_set(value)
 
@@ -4903,10 +5308,10 @@ class EdgeSeq(_EdgeSeq):
                     for v in value:
                         candidates.update(es.graph.incident(v))
 
-                    if not es.is_all():
+                    if not cur.is_all():
                         # Find those that are in the current edge sequence
                         filtered_idxs = [
-                            i for i, e in enumerate(es) if e.index in candidates
+                            i for i, eid in enumerate(cur.indices) if eid in candidates
                         ]
                     else:
                         # We are done, the filtered indexes are in the candidates set
@@ -4915,29 +5320,27 @@ class EdgeSeq(_EdgeSeq):
                 elif attr == "_within":
                     func = None  # ignoring function, filtering here
                     value = _ensure_set(value)
+                    endpoints = _get_edgelist()
 
-                    # Fetch all the edges that are incident on at least one of
-                    # the vertices specified
-                    candidates = set()
-                    for v in value:
-                        candidates.update(es.graph.incident(v))
-
-                    if not es.is_all():
+                    if not cur.is_all():
                         # Find those where both endpoints are OK
                         filtered_idxs = [
                             i
-                            for i, e in enumerate(es)
-                            if e.index in candidates
-                            and e.source in value
-                            and e.target in value
+                            for i, eid in enumerate(cur.indices)
+                            if endpoints[eid][0] in value and endpoints[eid][1] in value
                         ]
                     else:
                         # Optimized version when the edge sequence contains all
-                        # the edges exactly once in increasing order of edge IDs
+                        # the edges exactly once in increasing order of edge IDs.
+                        # Fetch all the edges that are incident on at least one
+                        # of the vertices specified
+                        candidates = set()
+                        for v in value:
+                            candidates.update(es.graph.incident(v))
                         filtered_idxs = [
                             i
                             for i in candidates
-                            if es[i].source in value and es[i].target in value
+                            if endpoints[i][0] in value and endpoints[i][1] in value
                         ]
 
                 elif attr == "_between":
@@ -4948,47 +5351,66 @@ class EdgeSeq(_EdgeSeq):
                     func = None  # ignoring function, filtering here
                     set1 = _ensure_set(value[0])
                     set2 = _ensure_set(value[1])
+                    endpoints = _get_edgelist()
 
-                    # Fetch all the edges that are incident on at least one of
-                    # the vertices specified
-                    candidates = set()
-                    for v in set1:
-                        candidates.update(es.graph.incident(v))
-                    for v in set2:
-                        candidates.update(es.graph.incident(v))
+                    def _is_between(eid):
+                        source, target = endpoints[eid]
+                        return (source in set1 and target in set2) or (
+                            target in set1 and source in set2
+                        )
 
-                    if not es.is_all():
+                    if not cur.is_all():
                         # Find those where both endpoints are OK
                         filtered_idxs = [
-                            i
-                            for i, e in enumerate(es)
-                            if (e.source in set1 and e.target in set2)
-                            or (e.target in set1 and e.source in set2)
+                            i for i, eid in enumerate(cur.indices) if _is_between(eid)
                         ]
                     else:
                         # Optimized version when the edge sequence contains all
-                        # the edges exactly once in increasing order of edge IDs
-                        filtered_idxs = [
-                            i
-                            for i in candidates
-                            if (es[i].source in set1 and es[i].target in set2)
-                            or (es[i].target in set1 and es[i].source in set2)
-                        ]
+                        # the edges exactly once in increasing order of edge IDs.
+                        # Fetch all the edges that are incident on at least one
+                        # of the vertices specified
+                        candidates = set()
+                        for v in set1:
+                            candidates.update(es.graph.incident(v))
+                        for v in set2:
+                            candidates.update(es.graph.incident(v))
+                        filtered_idxs = [i for i in candidates if _is_between(i)]
 
                 else:
                     # Method call, not an attribute
-                    values = getattr(es.graph, attr[1:])(es)
+                    values = columns.get(attr)
+                    if values is None:
+                        values = getattr(es.graph, attr[1:])(cur)
+                        if positions is None:
+                            columns[attr] = values
+                        else:
+                            columns[attr] = dict(zip(positions, values))
+                    elif positions is not None:
+                        values = [values[i] for i in positions]
+
+                # If we have a function to apply on the values, do that;
+                # otherwise we assume that filtered_idxs has already been
+                # calculated. Either way, map the indices back to es.
+                if func is not None:
+                    filtered_idxs = [i for i, v in enumerate(values) if func(v, value)]
+                if positions is None:
+                    positions = filtered_idxs
+                else:
+                    positions = [positions[i] for i in filtered_idxs]
             else:
-                values = es[attr]
-
-            # If we have a function to apply on the values, do that; otherwise
-            # we assume that filtered_idxs has already been calculated.
-            if func is not None:
-                filtered_idxs = [i for i, v in enumerate(values) if func(v, value)]
-
-            es = es.select(filtered_idxs)
+                values = columns.get(attr)
+                if values is None:
+                    values = columns[attr] = es[attr]
+                if positions is None:
+                    positions = _select_numeric(values, op, value)
+                    if positions is not None:
+                        continue
+                    candidates = enumerate(values)
+                else:
+                    candidates = ((i, values[i]) for i in positions)
+                positions = [i for i, v in candidates if func(v, value)]
 
-        return es
+        return es if positions is None else es.select(positions)
 
     def __call__(self, *args, **kwds):
         """Shorthand notation to select()
@@ -5019,17 +5441,17 @@ def _graphmethod(func=None, name=None):
         name = func.__name__
     method = getattr(Graph, name)
 
-    if hasattr(func, "__call__"):
+    # The sequence itself is passed on to the Graph method as its first
+    # argument after the graph, restricting the calculation to the sequence
+    if callable(func):
 
-        def decorated(*args, **kwds):
-            self = args[0].graph
-            return func(args[0], method(self, *args, **kwds))
+        def decorated(seq, *args, **kwds):
+            return func(seq, method(seq.graph, seq, *args, **kwds))
 
     else:
 
-        def decorated(*args, **kwds):
-            self = args[0].graph
-            return method(self, *args, **kwds)
+        def decorated(seq, *args, **kwds):
+            return method(seq.graph, seq, *args, **kwds)
 
     decorated.__name__ = name
     decorated.__doc__ = """Proxy method to L{Graph.%(name)s()}
@@ -5259,18 +5681,9 @@ def get_include():
     raise ValueError("cannot find the header files of the Python interface of igraph")
 
 
-def read(filename, *args, **kwds):
-    """Loads a graph from the given filename.
-
-    This is just a convenience function, calls L{Graph.Read} directly.
-    All arguments are passed unchanged to L{Graph.Read}
-
-    @param filename: the name of the file to be loaded
-    """
-    return Graph.Read(filename, *args, **kwds)
-
-
-load = read
+# Loading a graph from a file is the same as calling Graph.Read(), so the
+# convenience functions are simply aliases of it
+read = load = Graph.Read
 
 
 def write(graph, filename, *args, **kwds):
@@ -5288,5 +5701,41 @@ def write(graph, filename, *args, **kwds):
 save = write
 
 
-config = init_configuration()
 del construct_graph_from_formula
+
+
+def __getattr__(name):
+    """Imports the drawing-related names of the module and loads the
+    configuration on first access."""
+    if name == "config":
+        # Parsing the configuration file is deferred until it is needed
+        value = globals()["config"] = init_configuration()
+        return value
+
+    if name == "drawing":
+        return import_module("igraph.drawing")
+
+    module_name = _LAZY_DRAWING_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | set(_LAZY_DRAWING_IMPORTS) | {"config", "drawing"}
+    )
+
+
+# "from igraph import *" only sees names that are in the module namespace
+# unless __all__ is given; list the lazily created ones explicitly
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_")}
+    | set(_LAZY_DRAWING_IMPORTS)
+    | {"config", "drawing"}
+)
@@ -3,13 +3,13 @@
 """Classes related to graph clustering."""
 
 from copy import deepcopy
+from itertools import compress
 from math import pi
 from io import StringIO
 
 from igraph import community_to_membership
 from igraph.configuration import Configuration
 from igraph.datatypes import UniqueIdGenerator
-from igraph.drawing.colors import ClusterColoringPalette
 from igraph.statistics import Histogram
 from igraph.summary import _get_wrapper_for_width
 from igraph.utils import str_to_orientation
@@ -484,6 +484,8 @@ class VertexClustering(Clustering):
             ]
 
         if palette is None:
+            from igraph.drawing.colors import ClusterColoringPalette
+
             palette = ClusterColoringPalette(len(self))
 
         if "mark_groups" not in kwds:
@@ -549,7 +551,7 @@ class Dendrogram:
         """Creates a hierarchical clustering.
 
         @param merges: the merge history either in matrix or tuple format"""
-        self._merges = [tuple(pair) for pair in merges]
+        self._merges = list(map(tuple, merges))
         self._nmerges = len(self._merges)
         if self._nmerges:
             self._nitems = max(self._merges[-1]) - self._nmerges + 2
@@ -1330,6 +1332,8 @@ class VertexCover(Cover):
         if "palette" in kwds:
             palette = kwds["palette"]
         else:
+            from igraph.drawing.colors import ClusterColoringPalette
+
             palette = ClusterColoringPalette(len(self))
 
         if "mark_groups" not in kwds:
@@ -1492,7 +1496,7 @@ def _handle_mark_groups_arg_for_clustering(mark_groups, clustering):
     if mark_groups is True:
         group_iter = ((group, color) for color, group in enumerate(clustering))
     elif isinstance(mark_groups, dict):
-        group_iter = mark_groups.iteritems()
+        group_iter = mark_groups.items()
     elif hasattr(mark_groups, "__getitem__") and hasattr(mark_groups, "__len__"):
         # Lists, tuples
         try:
@@ -1515,7 +1519,7 @@ def _handle_mark_groups_arg_for_clustering(mark_groups, clustering):
         # Iterators etc
         group_iter = mark_groups
     else:
-        group_iter = {}.iteritems()
+        group_iter = iter(())
 
     def cluster_index_resolver():
         for group, color in group_iter:
@@ -1557,17 +1561,9 @@ def _prepare_community_comparison(comm1, comm2, remove_none=False):
         raise ValueError("the two membership vectors must be equal in length")
 
     if remove_none and (None in vec1 or None in vec2):
-        idxs_to_remove = [
-            i for i in range(len(vec1)) if vec1[i] is None or vec2[i] is None
-        ]
-        idxs_to_remove.reverse()
-        n = len(vec1)
-        for i in idxs_to_remove:
-            n -= 1
-            vec1[i], vec1[n] = vec1[n], vec1[i]
-            vec2[i], vec2[n] = vec2[n], vec2[i]
-        del vec1[n:]
-        del vec2[n:]
+        keep = [a is not None and b is not None for a, b in zip(vec1, vec2)]
+        vec1 = list(compress(vec1, keep))
+        vec2 = list(compress(vec2, keep))
 
     return vec1, vec2
 
@@ -1654,7 +1650,9 @@ def split_join_distance(comm1, comm2, remove_none=False):
       for all the vertices. If C{remove_none} is C{False}, a C{None} entry in
       either C{comm1} or C{comm2} will result in an exception. If C{remove_none}
       is C{True}, C{None} values are filtered away and only the remaining lists
-      are compared.
+      are compared. Membership vectors given as one-dimensional NumPy arrays of
+      integers of the same length cannot contain C{None}; they are used as
+      they are, without converting them to lists first.
 
     @return: the projection distance of C{comm1} from C{comm2} and vice versa
       in a tuple. The split-join distance is the sum of the two.
@@ -1670,5 +1668,62 @@ def split_join_distance(comm1, comm2, remove_none=False):
     """
     import igraph._igraph
 
-    vec1, vec2 = _prepare_community_comparison(comm1, comm2, remove_none)
+    if _is_integer_array(comm1) and _is_integer_array(comm2):
+        if comm1.shape != comm2.shape:
+            raise ValueError("the two membership vectors must be equal in length")
+        vec1, vec2 = comm1, comm2
+    else:
+        vec1, vec2 = _prepare_community_comparison(comm1, comm2, remove_none)
+
+    if len(vec1) >= _SPLIT_JOIN_SPARSE_MIN_SIZE:
+        result = _split_join_distance_sparse(vec1, vec2)
+        if result is not None:
+            return result
     return igraph._igraph._split_join_distance(vec1, vec2)
+
+
+def _is_integer_array(obj):
+    """Returns whether the given object is a one-dimensional NumPy array of
+    integers."""
+    try:
+        import numpy as np
+    except ImportError:
+        return False
+    return isinstance(obj, np.ndarray) and obj.ndim == 1 and obj.dtype.kind in "iu"
+
+
+# Shortest membership vectors for which split_join_distance() builds the
+# contingency table with SciPy instead of calling the C core
+_SPLIT_JOIN_SPARSE_MIN_SIZE = 10000
+
+
+def _split_join_distance_sparse(vec1, vec2):
+    """Calculates the two projection distances of the split-join distance
+    from a sparse contingency table built with NumPy and SciPy.
+
+    Returns C{None} if NumPy or SciPy is not installed, or if the membership
+    vectors are not lists of integers between zero and their length; these
+    are left to the C core, which also reports the errors."""
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        return None
+
+    vec1, vec2 = np.asarray(vec1), np.asarray(vec2)
+    n = len(vec1)
+    for vec in (vec1, vec2):
+        if vec.ndim != 1 or vec.dtype.kind not in "iu":
+            return None
+        if n and (vec.min() < 0 or vec.max() >= n):
+            return None
+
+    # Duplicate entries are summed when converting to CSR, so the table
+    # holds the size of the overlap of each pair of clusters
+    table = sparse.coo_matrix(
+        (np.ones(n, dtype=np.intp), (vec1, vec2)), shape=(n, n)
+    ).tocsr()
+    return (
+        n - int(table.max(axis=1).sum()),
+        n - int(table.max(axis=0).sum()),
+    )
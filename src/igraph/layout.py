@@ -9,7 +9,6 @@ This package contains the implementation of the L{Layout} object.
 
 from math import sin, cos, pi
 
-from igraph.drawing.utils import BoundingBox
 from igraph.statistics import RunningMean
 
 
@@ -335,6 +334,8 @@ class Layout:
         if self._dim != 2:
             raise ValueError("Layout.boundary_box() supports 2D layouts only")
 
+        from igraph.drawing.utils import BoundingBox
+
         try:
             (x0, y0), (x1, y1) = self.boundaries(border)
             return BoundingBox(x0, y0, x1, y1)
@@ -381,6 +382,8 @@ class Layout:
           the bounding box. If C{True}, the original aspect ratio of the layout
           will be kept and it will be centered within the bounding box.
         """
+        from igraph.drawing.utils import BoundingBox
+
         if isinstance(bbox, BoundingBox):
             if self._dim != 2:
                 raise TypeError("bounding boxes work for 2D layouts only")
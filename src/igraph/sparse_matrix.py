@@ -203,3 +203,37 @@ def _graph_from_weighted_sparse_matrix(
     return klass(
         nvert, edges=edges, directed=(mode == "directed"), edge_attrs={attr: weights}
     )
+
+
+def _graph_from_sparse_ndarray(klass, matrix, attr=None, loops=True):
+    """Construct directed graph from a dense NumPy matrix with few nonzeros
+
+    This avoids converting the matrix to a list of lists first. Edges are
+    created in row-major order, just like the C core does for dense
+    adjacency matrices. If ``attr`` is ``None``, the entries are edge
+    multiplicities and they are truncated to integers; otherwise they are
+    stored as edge weights in the given attribute.
+    """
+    # This function assumes there is numpy and the matrix is a square
+    # ndarray. The caller should make sure those conditions are met.
+    import numpy as np
+
+    rows, cols = np.nonzero(matrix)
+    values = matrix[rows, cols]
+
+    if attr is None:
+        counts = np.maximum(values.astype(np.intp), 0)
+        edges = np.repeat(np.column_stack((rows, cols)), counts, axis=0)
+        return klass(matrix.shape[0], edges=edges, directed=True)
+
+    if not loops:
+        mask = rows != cols
+        rows, cols, values = rows[mask], cols[mask], values[mask]
+
+    # Like the C core, do not create the attribute if there are no edges
+    return klass(
+        matrix.shape[0],
+        edges=np.column_stack((rows, cols)),
+        directed=True,
+        edge_attrs={attr: values.tolist()} if len(values) else None,
+    )
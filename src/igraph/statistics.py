@@ -214,6 +214,32 @@ class Histogram:
 
     __lshift__ = add_many
 
+    def add_counts(self, counts, start=0):
+        """Adds consecutive integers to the histogram, each of them repeated
+        as many times as given by the corresponding item of a count vector.
+
+        Adding C{counts} this way is equivalent to calling L{add()} with
+        M{start+i} and C{counts[i]} for every M{i}, but the bins are
+        allocated only once and zero counts are skipped altogether.
+
+        @param counts: the number of occurrences of each integer, starting
+          from C{start}
+        @param start: the integer that the first item of C{counts} refers to
+        """
+        items = [(value, count) for value, count in enumerate(counts, start) if count]
+        if not items:
+            return
+
+        # Allocate all the bins that we will need in advance
+        self._get_bin(float(items[0][0]), True)
+        self._get_bin(float(items[-1][0]), True)
+
+        bins, bin_min, bin_width = self._bins, self._min, self._bin_width
+        running_mean = self._running_mean
+        for value, count in items:
+            bins[int((value - bin_min) / bin_width)] += count
+            running_mean.add(value, count)
+
     def clear(self):
         """Clears the collected data"""
         self._bins = []
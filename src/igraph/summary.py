@@ -5,7 +5,7 @@
 import sys
 
 from igraph.statistics import median
-from itertools import islice
+from itertools import islice, repeat
 from math import ceil
 from texttable import Texttable
 from textwrap import TextWrapper
@@ -129,20 +129,19 @@ class GraphSummary:
         if self._graph.vcount() == 0:
             return
 
+        adjlist = self._graph.get_adjlist(mode="out")
         if self._graph.is_named():
             names = self._graph.vs["name"]
             maxlen = max(len(str(name)) for name in names)
             format_str = "%%%ds %s %%s" % (maxlen, self._arrow)
-            for v1, name in enumerate(names):
-                neis = self._graph.successors(v1)
+            for name, neis in zip(names, adjlist):
                 neis = ", ".join(str(names[v2]) for v2 in neis)
                 result.append(format_str % (name, neis))
         else:
             maxlen = len(str(self._graph.vcount()))
             num_format = "%%%dd" % maxlen
             format_str = "%s %s %%s" % (num_format, self._arrow)
-            for v1 in range(self._graph.vcount()):
-                neis = self._graph.successors(v1)
+            for v1, neis in enumerate(adjlist):
                 neis = " ".join(num_format % v2 for v2 in neis)
                 result.append(format_str % (v1, neis))
 
@@ -167,14 +166,14 @@ class GraphSummary:
         result = [self._edges_header]
         arrow = self._arrow_format
 
+        edgelist = self._graph.get_edgelist()
         if self._graph.is_named():
             names = self._graph.vs["name"]
             edges = ", ".join(
-                arrow % (names[edge.source], names[edge.target])
-                for edge in self._graph.es
+                arrow % (names[source], names[target]) for source, target in edgelist
             )
         else:
-            edges = " ".join(arrow % edge.tuple for edge in self._graph.es)
+            edges = " ".join(arrow % edge for edge in edgelist)
 
         result.append(edges)
         return result
@@ -265,20 +264,16 @@ class GraphSummary:
         in the summary. `attribute_order` must be a list containing the names of
         the attributes to be presented in this table."""
         arrow = self._arrow_format
-
+        edgelist = self._graph.get_edgelist()
         if self._graph.is_named():
             names = self._graph.vs["name"]
-            for edge in self._graph.es:
-                formatted_edge = arrow % (names[edge.source], names[edge.target])
-                yield ["[%d]" % edge.index, formatted_edge] + [
-                    edge[attr] for attr in attribute_order
-                ]
-        else:
-            for edge in self._graph.es:
-                formatted_edge = arrow % edge.tuple
-                yield ["[%d]" % edge.index, formatted_edge] + [
-                    edge[attr] for attr in attribute_order
-                ]
+            edgelist = [(names[source], names[target]) for source, target in edgelist]
+
+        # Attribute values are read column by column instead of edge by edge
+        columns = [self._graph.es[attr] for attr in attribute_order]
+        rows = zip(*columns) if columns else repeat(())
+        for index, (edge, values) in enumerate(zip(edgelist, rows)):
+            yield ["[%d]" % index, arrow % edge] + list(values)
 
     def _infer_column_alignment(self, vertex_attrs=None, edge_attrs=None):
         """Infers the preferred alignment for the given vertex and edge attributes
@@ -319,8 +314,10 @@ class GraphSummary:
         """Returns an iterator that yields the rows of the vertex attribute table
         in the summary. `attribute_order` must be a list containing the names of
         the attributes to be presented in this table."""
-        for vertex in self._graph.vs:
-            yield ["[%d]" % vertex.index] + [vertex[attr] for attr in attribute_order]
+        columns = [self._graph.vs[attr] for attr in attribute_order]
+        rows = zip(*columns) if columns else repeat((), self._graph.vcount())
+        for index, values in enumerate(rows):
+            yield ["[%d]" % index] + list(values)
 
     def __str__(self):
         """Returns the summary representation as a string."""
@@ -368,8 +365,6 @@ def summary(obj, stream=None, *args, **kwds):
     """
     if stream is None:
         stream = sys.stdout
-    if hasattr(obj, "summary"):
-        stream.write(obj.summary(*args, **kwds))
-    else:
-        stream.write(str(obj))
-    stream.write("\n")
+    method = getattr(obj, "summary", None)
+    text = str(obj) if method is None else method(*args, **kwds)
+    stream.write(text + "\n")
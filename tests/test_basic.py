@@ -338,6 +338,9 @@ class BasicTests(unittest.TestCase):
         self.assertTrue(g.get_adjlist(IN) == [[2], [0], [1], [2]])
         self.assertTrue(g.get_adjlist(ALL) == [[1, 2], [0, 2], [0, 1, 3], [2]])
 
+        g = Graph(3, [(0, 1), (1, 1), (0, 1), (1, 2)])
+        self.assertTrue(g.get_adjlist() == [[1, 1], [0, 0, 1, 1, 2], [1]])
+
     def testEdgeIncidence(self):
         g = Graph(4, [(0, 1), (1, 2), (2, 0), (2, 3)], directed=True)
         self.assertTrue(g.incident(2) == [2, 3])
@@ -347,6 +350,9 @@ class BasicTests(unittest.TestCase):
         self.assertTrue(g.get_inclist(IN) == [[2], [0], [1], [3]])
         self.assertTrue(g.get_inclist(ALL) == [[0, 2], [0, 1], [2, 1, 3], [3]])
 
+        g = Graph(3, [(0, 1), (1, 1), (0, 1), (1, 2)])
+        self.assertTrue(g.get_inclist() == [[2, 0], [2, 0, 1, 1, 3], [3]])
+
     def testMultiplesLoops(self):
         g = Graph.Tree(7, 2)
 
@@ -514,6 +520,19 @@ class GraphDictListTests(unittest.TestCase):
         self.assertTrue(g.es["advice"] == [4, 5, 5, 4, 2])
         self.assertTrue(g.get_edgelist() == [(0, 1), (1, 2), (0, 2), (0, 3), (1, 3)])
 
+    def testGraphFromDictListMissingKeys(self):
+        del self.vertices[0]["age"]
+        del self.vertices[3]["gender"]
+        self.vertices[2]["nickname"] = "Cec"
+        del self.edges[4]["advice"]
+        self.edges[1]["weight"] = 2
+        g = Graph.DictList(self.vertices, self.edges)
+        self.assertTrue(g.vs["age"] == [None, 33, 45, 34])
+        self.assertTrue(g.vs["gender"] == ["F", "M", "F", None])
+        self.assertTrue(g.vs["nickname"] == [None, None, "Cec", None])
+        self.assertTrue(g.es["advice"] == [4, 5, 5, 4, None])
+        self.assertTrue(g.es["weight"] == [None, 2, None, None, None])
+
     def testGraphFromDictListAlternativeName(self):
         for vdata in self.vertices:
             vdata["name_alternative"] = vdata["name"]
@@ -715,6 +734,19 @@ class DegreeSequenceTests(unittest.TestCase):
         self.assertTrue(is_graphical_degree_sequence([3, 3, 3, 3, 4]))
 
 
+class ModuleTests(unittest.TestCase):
+    def testLazyDrawingImports(self):
+        import igraph
+        from igraph.drawing import plot
+        from igraph.drawing.colors import known_colors
+
+        self.assertTrue(igraph.plot is plot)
+        self.assertTrue(igraph.known_colors is known_colors)
+        self.assertTrue("plot" in dir(igraph))
+        self.assertTrue("Palette" in igraph.__all__)
+        self.assertRaises(AttributeError, getattr, igraph, "no_such_name")
+
+
 class InheritedGraph(Graph):
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
@@ -765,6 +797,7 @@ def suite():
     graph_dict_list_suite = unittest.makeSuite(GraphDictListTests)
     graph_tuple_list_suite = unittest.makeSuite(GraphTupleListTests)
     degree_sequence_suite = unittest.makeSuite(DegreeSequenceTests)
+    module_suite = unittest.makeSuite(ModuleTests)
     inheritance_suite = unittest.makeSuite(InheritanceTests)
     return unittest.TestSuite(
         [
@@ -773,6 +806,7 @@ def suite():
             graph_dict_list_suite,
             graph_tuple_list_suite,
             degree_sequence_suite,
+            module_suite,
             inheritance_suite,
         ]
     )
@@ -11,6 +11,18 @@ class BipartiteTests(unittest.TestCase):
         self.assertTrue(g.is_bipartite())
         self.assertTrue(g.vs["type"] == [False, True] * 5)
 
+    def testCreateBipartiteFromNumPy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy is a dependency of this test.")
+
+        edges = [(0, 1), (2, 3)]
+        for types in (np.array([0, 1, 0, 1]), np.array([False, True] * 2)):
+            g = Graph.Bipartite(types, edges)
+            self.assertTrue(g.vs["type"] == [False, True] * 2)
+            self.assertTrue(all(type(x) is bool for x in g.vs["type"]))
+
     def testFullBipartite(self):
         g = Graph.Full_Bipartite(10, 5)
         self.assertTrue(
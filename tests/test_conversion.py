@@ -1,7 +1,7 @@
 import random
 import unittest
 
-from igraph import Graph, Matrix
+from igraph import Graph, Matrix, GET_ADJACENCY_LOWER, GET_ADJACENCY_UPPER
 
 
 class DirectedUndirectedTests(unittest.TestCase):
@@ -139,6 +139,32 @@ class GraphRepresentationTests(unittest.TestCase):
             )
             - 1
         )
+        self.assertTrue(
+            g.get_adjacency(GET_ADJACENCY_UPPER, attribute="weight", default=None)
+            == Matrix(
+                [
+                    [None, 0, 1, 2, None, None],
+                    [None, None, None, None, 3, 4],
+                    [None, None, None, None, None, None],
+                    [None, None, None, None, None, None],
+                    [None, None, None, None, None, None],
+                    [None, None, None, None, None, None],
+                ]
+            )
+        )
+        self.assertTrue(
+            g.get_adjacency(GET_ADJACENCY_LOWER, attribute="weight")
+            == Matrix(
+                [
+                    [0, 0, 0, 0, 0, 0],
+                    [0, 0, 0, 0, 0, 0],
+                    [1, 0, 0, 0, 0, 0],
+                    [2, 0, 0, 0, 0, 0],
+                    [0, 3, 0, 0, 0, 0],
+                    [0, 4, 0, 0, 0, 0],
+                ]
+            )
+        )
 
         # Directed case
         g = Graph.Tree(6, 3, "tree_out")
@@ -7,6 +7,7 @@ from igraph import (
     CohesiveBlocks,
     Cover,
     Graph,
+    GraphBase,
     Histogram,
     InternalError,
     UniqueIdGenerator,
@@ -72,6 +73,12 @@ class DecompositionTests(unittest.TestCase):
         edgelist.sort()
         self.assertTrue(edgelist == [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)])
 
+        cores = g.k_core(2, [1])
+        self.assertEqual([7, 11], [core.vcount() for core in cores])
+        cores = g.k_core()
+        self.assertEqual([11, 11, 7, 4] + [0] * 7, [core.vcount() for core in cores])
+        self.assertEqual([1], [core.vcount() for core in Graph(1).k_core()])
+
 
 class ClusteringTests(unittest.TestCase):
     def setUp(self):
@@ -140,6 +147,22 @@ class VertexClusteringTests(unittest.TestCase):
         self.assertTrue(clg.vs["string"] == ["aaa", "bbc", "ccab"])
         self.assertTrue(clg.vs["int"] == [41, 64, 47])
 
+    def testModularity(self):
+        cl = VertexClustering(self.graph, [0, 0, 0, 1, 1, 1, 2, 2, 2, 2])
+        self.assertAlmostEqual(
+            self.graph.modularity(cl.membership), self.graph.modularity(cl)
+        )
+        self.assertRaises(ValueError, self.graph.copy().modularity, cl)
+
+    def testMarkGroupsFromDict(self):
+        from igraph.clustering import _handle_mark_groups_arg_for_clustering
+
+        cl = VertexClustering(self.graph, [0, 0, 0, 1, 1, 1, 2, 2, 2, 2])
+        groups = list(_handle_mark_groups_arg_for_clustering({2: "red"}, cl))
+        self.assertEqual([([6, 7, 8, 9], "red")], groups)
+        groups = list(_handle_mark_groups_arg_for_clustering(None, cl))
+        self.assertEqual([], groups)
+
 
 class CoverTests(unittest.TestCase):
     def setUp(self):
@@ -282,6 +305,13 @@ class CommunityTests(unittest.TestCase):
             or cl.membership == [0, 1, 1, 1]
             or cl.membership == [0, 0, 0, 1]
         )
+        g.vs["fixed"] = [True, None, 0, "yes"]
+        cl = g.community_label_propagation(initial="initial", fixed="fixed")
+        self.assertTrue(
+            cl.membership == [0, 0, 1, 1]
+            or cl.membership == [0, 1, 1, 1]
+            or cl.membership == [0, 0, 0, 1]
+        )
 
     def testMultilevel(self):
         # Example graph from the paper
@@ -327,6 +357,18 @@ class CommunityTests(unittest.TestCase):
         self.assertAlmostEqual(cls[0].q, 0.346301, places=5)
         self.assertAlmostEqual(cls[1].q, 0.392219, places=5)
 
+        cl = g.community_multilevel()
+        self.assertAlmostEqual(cl.q, g.modularity(cl.membership), places=7)
+
+        # Without the levels, GraphBase returns the final membership and its
+        # modularity
+        result = GraphBase.community_multilevel(g)
+        self.assertTrue(isinstance(result, tuple) and len(result) == 2)
+        membership, q = result
+        self.assertTrue(isinstance(membership, list) and len(membership) == 16)
+        self.assertAlmostEqual(q, g.modularity(membership), places=7)
+        self.assertTrue(Graph(3).community_multilevel().membership == [0, 1, 2])
+
     def testOptimalModularity(self):
         try:
             g = Graph.Famous("bull")
@@ -587,6 +629,28 @@ class ComparisonTests(unittest.TestCase):
         l1 = [1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 3]
         l2 = [3, 1, 2, 1, 3, 1, 3, 1, 2, 1, 4, 2]
         self.assertEqual(split_join_distance(l1, l2), (6, 5))
+        # Long membership vectors may take a different code path
+        self.assertEqual(split_join_distance(l1 * 1000, l2 * 1000), (6000, 5000))
+        l1 = [i % 997 for i in range(20000)]
+        l2 = [i % 1009 for i in range(20000)]
+        self.assertEqual(
+            sum(split_join_distance(l1, l2)),
+            compare_communities(l1, l2, method="split_join"),
+        )
+
+    def testCompareSplitJoinNumPy(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy not available")
+
+        l1 = np.array([1, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 3], dtype=np.int32)
+        l2 = np.array([3, 1, 2, 1, 3, 1, 3, 1, 2, 1, 4, 2])
+        self.assertEqual(split_join_distance(l1, l2), (6, 5))
+        self.assertEqual(
+            split_join_distance(np.tile(l1, 1000), np.tile(l2, 1000)), (6000, 5000)
+        )
+        self.assertRaises(ValueError, split_join_distance, l1, l2[:-1])
 
     def testCompareRand(self):
         expected = [1, 2 / 3.0, 0, 0.590909]
@@ -274,6 +274,43 @@ class EdgeSeqTests(unittest.TestCase):
         self.assertTrue(len(g.es(betweenness_gt=10)) < 2000)
         self.assertTrue(len(g.es(betweenness_gt=10, parity=0)) < 2000)
 
+    def testChainedKeywordFilteringSelect(self):
+        g = Graph.Lattice([4, 4], circular=False)
+        g.es["weight"] = [None if i % 3 == 0 else i for i in range(g.ecount())]
+        expected = [
+            e.index
+            for e in g.es
+            if e.source < 8 and e.target < 8 and e["weight"] is not None
+            and e["weight"] > 2
+        ]
+        subset = g.es.select(weight_ne=None, weight_gt=2, _within=range(8))
+        self.assertTrue(sorted(subset.indices) == expected)
+        subset = g.es.select(weight_ne=None, _within=range(8), weight_gt=2)
+        self.assertTrue(sorted(subset.indices) == expected)
+        subset = g.es.select(_incident=[5], weight_ne=None)
+        self.assertTrue(
+            subset.indices
+            == [e.index for e in g.es.select(_incident=[5]) if e["weight"] is not None]
+        )
+
+    def testRepeatedPropertyFilteringSelect(self):
+        calls = []
+
+        class CountingGraph(Graph):
+            def score(self, es):
+                calls.append(len(es))
+                return [e.index * 2 for e in es]
+
+        g = CountingGraph.Ring(10, directed=True)
+        subset = g.es.select(_score_gt=4, _score_lt=15)
+        self.assertTrue(subset.indices == [3, 4, 5, 6, 7])
+        self.assertTrue(calls == [10])
+
+        del calls[:]
+        subset = g.es.select(_source_in=range(8), _score_gt=4, _score_ne=10)
+        self.assertTrue(subset.indices == [3, 4, 6, 7])
+        self.assertTrue(calls == [8])
+
     def testSourceTargetFiltering(self):
         g = Graph.Barabasi(1000, 2, directed=True)
         es1 = set(e.source for e in g.es.select(_target_in=[2, 4]))
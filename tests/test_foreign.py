@@ -1,7 +1,10 @@
 import gzip
 import io
+import os
+import tempfile
 import unittest
 import warnings
+from pathlib import Path
 
 from igraph import Graph, InternalError
 
@@ -346,6 +349,71 @@ class ForeignTests(unittest.TestCase):
             )
 
             g.write_adjacency(tmpfname)
+            with open(tmpfname) as fp:
+                self.assertEqual(
+                    "0 1 1 0 0 0\n1 0 1 0 0 0\n1 1 0 0 0 0\n"
+                    "0 0 0 0 1 1\n0 0 0 1 0 1\n0 0 0 1 1 0\n",
+                    fp.read(),
+                )
+
+            g.write_adjacency(Path(tmpfname), eol="\r\n")
+            with open(tmpfname, newline="") as fp:
+                self.assertTrue(fp.read().startswith("0 1 1 0 0 0\r\n1 0 1"))
+            self.assertEqual(Graph.Read_Adjacency(Path(tmpfname)).ecount(), 12)
+
+    def testIdentifyFormat(self):
+        cases = [
+            ("", "edges"),
+            ("1 2", "edges"),
+            ("a b\n", "edges"),
+            ("\n", "adjacency"),
+            ("1 2\n3 4 5\n", None),
+            ("1 2\n3 4\n", None),
+            ("1 2\n3 4\n\n", None),
+            ("1 2\n3 4\n5 6\n", "edges"),
+            ("1 2\n3 4\n5 6 7\n", "edges"),
+            ("0 1 1\n1 0 1\n1 1 0\n", "adjacency"),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "graph.txt")
+            for content, expected in cases:
+                with open(fname, "w") as fp:
+                    fp.write(content)
+                self.assertEqual(expected, Graph._identify_format(fname))
+
+    def testWriteSVG(self):
+        g = Graph([(0, 1), (1, 2)], directed=True)
+        f = io.StringIO()
+        g.write_svg(f, layout=[(0, 0), (1, 0), (1, 1)], width=120, vertex_size=10)
+        svg = f.getvalue()
+        self.assertIn('<g id="g1" transform="translate(110.0,10.0)">', svg)
+        self.assertIn('d="M 10.0,10.0 100.0,10.0"', svg)
+        self.assertEqual(3, svg.count("<circle"))
+
+        # Shapes may be any sequence and may be shorter than the vertex list
+        for shapes in ((1, 2, 1), [2]):
+            f = io.StringIO()
+            g.write_svg(f, layout=[(0, 0), (1, 0), (1, 1)], shapes=shapes)
+            svg = f.getvalue()
+            self.assertEqual(1, svg.count("<rect"))
+            self.assertEqual(2, svg.count("<circle"))
+        self.assertEqual([2], shapes)
+
+    def testSparseAdjacency(self):
+        matrix = [[0] * 12 for _ in range(12)]
+        matrix[0][3], matrix[3][0], matrix[5][5], matrix[11][2] = 2, 1, 3, 0.5
+        content = "\n".join(" ".join(str(x) for x in row) for row in matrix)
+        with temporary_file(content) as tmpfname:
+            g = Graph.Read_Adjacency(tmpfname)
+            self.assertTrue(g.vcount() == 12 and g.is_directed())
+            self.assertEqual(
+                Graph.Adjacency(matrix).get_edgelist(), g.get_edgelist()
+            )
+            g = Graph.Read_Adjacency(tmpfname, attribute="weight", loops=False)
+            self.assertEqual([(0, 3), (3, 0), (11, 2)], g.get_edgelist())
+            self.assertEqual([2, 1, 0.5], g.es["weight"])
+            g = Graph.Read_Adjacency(tmpfname, mode="undirected")
+            self.assertFalse(g.is_directed())
 
     def testGraphML(self):
         with temporary_file(GRAPHML_EXAMPLE_FILE) as tmpfname:
@@ -428,6 +496,9 @@ class ForeignTests(unittest.TestCase):
             self.assertTrue(g.vcount() == 3 and g.ecount() == 1 and not g.is_directed())
             g.write_pickle(tmpfname)
 
+        g = Graph.Read_Pickle(Graph.Ring(5).write_pickle())
+        self.assertTrue(g.vcount() == 5 and g.ecount() == 5)
+
     @unittest.skipIf(pd is None, "test case depends on Pandas")
     def testVertexDataFrames(self):
         g = Graph([(0, 1), (0, 2), (0, 3), (1, 2), (2, 4)])
@@ -166,6 +166,25 @@ class LayoutAlgorithmTests(unittest.TestCase):
             list(zip(list(range(20)), list(range(20, 40)), list(range(40, 60)))),
         )
 
+    def testLayoutNames(self):
+        class CustomGraph(Graph):
+            def layout_circle(self, *args, **kwds):
+                return [(0, 0)] * self.vcount()
+
+        class BrokenGraph(Graph):
+            layout_circle = None
+
+        g = Graph.Ring(5)
+        for _ in range(2):
+            self.assertEqual(3, g.layout("Sphere").dim)
+            self.assertEqual(3, g.layout("kk_3d").dim)
+            self.assertEqual(3, g.layout("kk3d").dim)
+            self.assertEqual(2, g.layout("kk").dim)
+            self.assertEqual([1.0, 0.0], g.layout("circle")[0])
+            self.assertEqual([0, 0], CustomGraph.Ring(5).layout("circle")[0])
+            self.assertRaises(KeyError, g.layout, "no_such_layout")
+            self.assertRaises(ValueError, BrokenGraph.Ring(5).layout, "circle")
+
     def testCircle(self):
         def test_is_proper_circular_layout(graph, layout):
             xs, ys = list(zip(*layout))
@@ -417,6 +417,28 @@ class OperatorTests(unittest.TestCase):
             and g.clusters().membership == [0, 1, 2, 2]
         )
 
+    def testSubtraction(self):
+        g0 = Graph.Full(4)
+
+        g = g0 - 3
+        self.assertTrue(g.vcount() == 3 and g.ecount() == 3 and g0.vcount() == 4)
+        g = g0 - (0, 1)
+        self.assertTrue(g.vcount() == 4 and g.ecount() == 5 and g0.ecount() == 6)
+        g = g0 - [(0, 1), (2, 3)]
+        self.assertTrue(g.ecount() == 4)
+        g = g0 - g0.vs[[0, 1]]
+        self.assertTrue(g.vcount() == 2 and g.ecount() == 1)
+        g = g0 - g0.es[0]
+        self.assertTrue(g.ecount() == 5)
+
+        g = g0 - []
+        self.assertTrue(g is not g0 and g.get_edgelist() == g0.get_edgelist())
+        g = g0 + 0
+        self.assertTrue(g is not g0 and g.vcount() == 4)
+
+        self.assertRaises(TypeError, lambda: g0 - 1.5)
+        self.assertRaises(TypeError, lambda: g0 - [1.5])
+
     def testNonzero(self):
         self.assertTrue(Graph(1))
         self.assertFalse(Graph(0))
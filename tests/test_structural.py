@@ -151,6 +151,17 @@ class DegreeTests(unittest.TestCase):
         self.assertTrue(self.gdir.degree(vs, mode=ALL) == [4, 3])
         self.assertTrue(self.gdir.degree(self.gdir.vs[1], mode=ALL) == 4)
 
+    def testDegreeDistribution(self):
+        h = self.g.degree_distribution()
+        self.assertEqual(
+            [(2, 3, 2), (3, 4, 1), (4, 5, 0), (5, 6, 1)], list(h.bins())
+        )
+        self.assertAlmostEqual(3.0, h.mean)
+        h = self.gdir.degree_distribution(2, mode=IN)
+        self.assertEqual([(0, 2, 1), (2, 4, 3)], list(h.bins()))
+        self.assertEqual(10, self.gempty.degree_distribution(2).n)
+        self.assertEqual(0, Graph().degree_distribution().n)
+
     def testMaxDegree(self):
         self.assertTrue(self.gfull.maxdegree() == 9)
         self.assertTrue(self.gempty.maxdegree() == 0)
@@ -859,6 +870,8 @@ class PathTests(unittest.TestCase):
             [(int(value), x) for value, _, x in h.bins()]
             == [(1, 14), (2, 19), (3, 20), (4, 20), (5, 16), (6, 16)]
         )
+        self.assertEqual(105, h.n)
+        self.assertAlmostEqual(368 / 105, h.mean)
         g = Graph.Full(5) + Graph.Full(4)
         h = g.path_length_hist()
         self.assertTrue(h.unconnected == 20)
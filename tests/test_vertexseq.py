@@ -315,6 +315,87 @@ class VertexSeqTests(unittest.TestCase):
         del g.vs["degree"]
         self.assertTrue(len(g.vs(_degree_gt=30)) == l)
 
+    def testChainedKeywordFilteringSelect(self):
+        g = Graph.Star(6)
+        g.vs["age"] = [None, 5, 3, None, 8, 1]
+        # Filters are applied in order, so later ones never see the
+        # vertices that were dropped by earlier ones
+        subset = g.vs.select(age_ne=None, age_gt=2)
+        self.assertTrue(subset.indices == [1, 2, 4])
+        subset = g.vs.select([5, 4, 3, 2], age_ne=None, _degree=1, age_lt=5)
+        self.assertTrue(subset.indices == [5, 2])
+        self.assertTrue(len(g.vs.select(age_ne=None, age_gt=10, _degree=1)) == 0)
+
+    def testMembershipFilteringSelect(self):
+        self.assertTrue(self.g.vs.select(name_in="ACE").indices == [0, 2, 4])
+        self.assertTrue(self.g.vs.select(test_in=[3, 5, 11]).indices == [3, 5])
+        subset = self.g.vs.select(test_notin=(0, 1))
+        self.assertTrue(subset.indices == list(range(2, 10)))
+        self.g.vs["pair"] = [[i, i + 1] for i in range(10)]
+        self.assertTrue(self.g.vs.select(pair_in=[[2, 3], [5, 6]]).indices == [2, 5])
+        # Type errors other than unhashable items in a list that was turned
+        # into a set internally are not masked
+        self.assertRaises(TypeError, self.g.vs.select, test_in="x1")
+        self.assertRaises(TypeError, self.g.vs.select, pair_in={(2, 3)})
+
+    def testLargeNumericFilteringSelect(self):
+        g = Graph.Ring(3000)
+        g.vs["weight"] = [(i * 7919) % 101 / 4 for i in range(g.vcount())]
+        g.vs["count"] = [(i * 7919) % 101 for i in range(g.vcount())]
+        g.vs["mixed"] = [None if i % 5 == 0 else i for i in range(g.vcount())]
+        for attr, value in (("weight", 12.5), ("count", 50), ("count", 50.5)):
+            values = g.vs[attr]
+            for op, func in (("lt", lambda a, b: a < b), ("eq", lambda a, b: a == b)):
+                subset = g.vs.select(**{attr + "_" + op: value})
+                expected = [i for i, v in enumerate(values) if func(v, value)]
+                self.assertTrue(subset.indices == expected)
+                self.assertTrue(all(type(i) is int for i in subset.indices))
+        subset = g.vs.select(mixed_ne=None, mixed_gt=2990)
+        self.assertTrue(
+            subset.indices == [2991, 2992, 2993, 2994, 2996, 2997, 2998, 2999]
+        )
+        self.assertTrue(g.vs.select(_degree_gt=1).indices == list(range(3000)))
+
+        # Large integers must not be rounded by a conversion to floats, no
+        # matter how long the column is
+        big = 2 ** 53
+        for n in (10, 2000):
+            g = Graph(n)
+            g.vs["y"] = [big + 1] + [0.5] * (n - 1)
+            self.assertTrue(g.vs.select(y_eq=big).indices == [])
+            self.assertTrue(g.vs.select(y_gt=big).indices == [0])
+            g.vs["y"] = [big + 1] + [0] * (n - 1)
+            self.assertTrue(g.vs.select(y_eq=float(big)).indices == [])
+            g.vs["y"] = [float(big)] + [0.5] * (n - 1)
+            self.assertTrue(g.vs.select(y_eq=big + 1).indices == [])
+            g.vs["y"] = [-(2 ** 63)] + [0] * (n - 1)
+            self.assertTrue(g.vs.select(y_lt=-big).indices == [0])
+
+    def testRepeatedPropertyFilteringSelect(self):
+        calls = []
+
+        class CountingGraph(Graph):
+            def score(self, vs):
+                calls.append(len(vs))
+                return [v.index * 2 for v in vs]
+
+        g = CountingGraph.Ring(10)
+        subset = g.vs.select(_score_gt=4, _score_lt=15)
+        self.assertTrue(subset.indices == [3, 4, 5, 6, 7])
+        self.assertTrue(calls == [10])
+
+        del calls[:]
+        subset = g.vs.select([1, 2, 3, 4, 5, 6], _score_ge=4, _score_ne=8)
+        self.assertTrue(subset.indices == [2, 3, 5, 6])
+        self.assertTrue(calls == [6])
+
+        # Values computed on the vertices left by an earlier filter are reused
+        del calls[:]
+        g.add_vertices(2)
+        subset = g.vs.select(_degree_gt=1, _score_gt=4, _score_lt=15, _score_ne=10)
+        self.assertTrue(subset.indices == [3, 4, 6, 7])
+        self.assertTrue(calls == [10])
+
     def testIndexAndKeywordFilteringFind(self):
         self.assertRaises(ValueError, self.g.vs.find, 2, name="G")
         self.assertRaises(ValueError, self.g.vs.find, 2, test=4)